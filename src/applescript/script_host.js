@@ -0,0 +1,86 @@
+// script_host.js
+// Long-lived AppleScript host for AppleScriptRunner (run with osascript -l JavaScript)
+//
+// Requests arrive on stdin as a 10-digit byte length, a newline and the
+// AppleScript source. Each response is "S" (success) or "E" (error), a
+// 10-digit byte length, a newline and the result text. Compiled scripts are
+// kept by source so repeated scripts skip compilation.
+
+ObjC.import('Foundation');
+
+var MAX_CACHED_SCRIPTS = 64;
+
+function run() {
+    var stdin = $.NSFileHandle.fileHandleWithStandardInput;
+    var stdout = $.NSFileHandle.fileHandleWithStandardOutput;
+    var buffer = $.NSMutableData.data;
+    var compiled = {};
+    var compiledCount = 0;
+
+    function read(length) {
+        while (buffer.length < length) {
+            var chunk = stdin.availableData;
+            if (chunk.length === 0) {
+                return null;
+            }
+            buffer.appendData(chunk);
+        }
+        var data = buffer.subdataWithRange($.NSMakeRange(0, length));
+        buffer = $.NSMutableData.dataWithData(
+            buffer.subdataWithRange($.NSMakeRange(length, buffer.length - length))
+        );
+        return data;
+    }
+
+    function write(status, text) {
+        var payload = $.NSString.alloc.initWithUTF8String(text).dataUsingEncoding($.NSUTF8StringEncoding);
+        var header = status + ('0000000000' + payload.length).slice(-10) + '\n';
+        stdout.writeData($.NSString.alloc.initWithUTF8String(header).dataUsingEncoding($.NSUTF8StringEncoding));
+        stdout.writeData(payload);
+    }
+
+    function descriptorText(descriptor) {
+        var text = descriptor.stringValue;
+        if (!text.isNil()) {
+            return ObjC.unwrap(text);
+        }
+        var items = [];
+        for (var i = 1; i <= descriptor.numberOfItems; i++) {
+            items.push(descriptorText(descriptor.descriptorAtIndex(i)));
+        }
+        return items.join(', ');
+    }
+
+    while (true) {
+        var header = read(11);
+        if (header === null) {
+            return;
+        }
+        var length = parseInt(ObjC.unwrap($.NSString.alloc.initWithDataEncoding(header, $.NSUTF8StringEncoding)), 10);
+        var body = read(length);
+        if (body === null) {
+            return;
+        }
+        var source = ObjC.unwrap($.NSString.alloc.initWithDataEncoding(body, $.NSUTF8StringEncoding));
+
+        var script = compiled[source];
+        if (script === undefined) {
+            if (compiledCount >= MAX_CACHED_SCRIPTS) {
+                compiled = {};
+                compiledCount = 0;
+            }
+            script = $.NSAppleScript.alloc.initWithSource(source);
+            compiled[source] = script;
+            compiledCount++;
+        }
+
+        var error = Ref();
+        var result = script.executeAndReturnError(error);
+        if (result.isNil()) {
+            var message = error[0] ? ObjC.unwrap(error[0].objectForKey('NSAppleScriptErrorMessage')) : '';
+            write('E', message || 'unknown error');
+        } else {
+            write('S', descriptorText(result));
+        }
+    }
+}
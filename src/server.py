@@ -27,6 +27,16 @@ from .tools.guided_presentation import GuidedPresentationTools
 from .utils import KeynoteError, AppleScriptError, FileOperationError, ParameterError
 
 
+# Zen tools only read slide text, so they keep its cache; any other tool may change it
+_ZEN_ANALYSIS_TOOLS = frozenset({
+    "validate_zen_principles",
+    "detect_text_overload",
+    "suggest_story_structure",
+    "apply_kanso_principles",
+    "check_back_row_visibility",
+})
+
+
 class KeynoteMCPServer:
     """Keynote MCP Server"""
     
@@ -43,6 +53,8 @@ class KeynoteMCPServer:
         self.guided_presentation_tools = GuidedPresentationTools()
         # Zen validation tools for Presentation Zen principles
         self.zen_validation_tools = ZenValidationTools()
+        # Slide tools keep their cached slide counts current; other tools may add slides
+        self._slide_tool_names = frozenset(tool.name for tool in self.slide_tools.get_tools())
         
         # Register handlers
         self._register_handlers()
@@ -88,14 +100,20 @@ class KeynoteMCPServer:
             # Only include essential slide operations that don't bypass the guided workflow
             essential_slide_tools = [tool for tool in self.slide_tools.get_tools() 
                                    if tool.name in ["delete_slide", "duplicate_slide", "move_slide", 
-                                                  "get_slide_count", "select_slide", "get_slide_info", 
-                                                  "set_slide_layout", "get_available_layouts"]]
+                                                  "get_slide_count", "select_slide", "get_slide_info", "get_all_slide_info", 
+                                                  "set_slide_layout", "get_available_layouts",
+                                                  "bulk_slide_operations"]]
             tools.extend(essential_slide_tools)
             return tools
         
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict[str, Any]) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
             """Call tool"""
+            if name not in _ZEN_ANALYSIS_TOOLS:
+                self.zen_validation_tools.invalidate_cache()
+            if name not in self._slide_tool_names:
+                self.slide_tools.navigation_ops.invalidate_slide_count()
+            
             try:
                 # Presentation management tools
                 if name == "create_presentation":
@@ -110,7 +128,8 @@ class KeynoteMCPServer:
                     )
                 elif name == "save_presentation":
                     return await self.presentation_tools.save_presentation(
-                        doc_name=arguments.get("doc_name", "")
+                        doc_name=arguments.get("doc_name", ""),
+                        wait=arguments.get("wait", True)
                     )
                 elif name == "close_presentation":
                     return await self.presentation_tools.close_presentation(
@@ -129,7 +148,9 @@ class KeynoteMCPServer:
                         doc_name=arguments.get("doc_name", "")
                     )
                 elif name == "get_available_themes":
-                    return await self.presentation_tools.get_available_themes()
+                    return await self.presentation_tools.get_available_themes(
+                        refresh=arguments.get("refresh", False)
+                    )
                 elif name == "get_presentation_resolution":
                     return await self.presentation_tools.get_presentation_resolution(
                         doc_name=arguments.get("doc_name", "")
@@ -138,6 +159,10 @@ class KeynoteMCPServer:
                     return await self.presentation_tools.get_slide_size(
                         doc_name=arguments.get("doc_name", "")
                     )
+                elif name == "batch_presentation_queries":
+                    return await self.presentation_tools.run_batch(
+                        calls=arguments["calls"]
+                    )
                 
                 # Zen validation tools (HIGHEST PRIORITY - Presentation Zen principles)
                 elif name == "validate_zen_principles":
@@ -216,6 +241,10 @@ class KeynoteMCPServer:
                         to_position=arguments["to_position"],
                         doc_name=arguments.get("doc_name", "")
                     )
+                elif name == "bulk_slide_operations":
+                    return await self.slide_tools.bulk_slide_operations(
+                        operations=arguments["operations"]
+                    )
                 elif name == "get_slide_count":
                     return await self.slide_tools.get_slide_count(
                         doc_name=arguments.get("doc_name", "")
@@ -236,6 +265,10 @@ class KeynoteMCPServer:
                         slide_number=arguments["slide_number"],
                         doc_name=arguments.get("doc_name", "")
                     )
+                elif name == "get_all_slide_info":
+                    return await self.slide_tools.get_all_slide_info(
+                        doc_name=arguments.get("doc_name", "")
+                    )
                 elif name == "get_available_layouts":
                     return await self.slide_tools.get_available_layouts(
                         doc_name=arguments.get("doc_name", "")
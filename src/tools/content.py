@@ -11,8 +11,8 @@ from ..utils import AppleScriptRunner, validate_slide_number, validate_coordinat
 class ContentTools:
     """Content management tools class - uses modular AppleScript files"""
     
-    def __init__(self):
-        self.runner = AppleScriptRunner()
+    def __init__(self, runner: Optional[AppleScriptRunner] = None):
+        self.runner = runner or AppleScriptRunner.instance()
         # Define which AppleScript file contains each function
         self.script_files = {
             # Text content functions
@@ -169,7 +169,7 @@ class ContentTools:
                 x, y = 100.0, 200.0
             
             # Use modular AppleScript function
-            result = self.runner.run_function(
+            result = await self.runner.run_function_async(
                 script_file=self.script_files['addTextBox'],
                 function_name='addTextBox',
                 args=["", slide_number, text, x, y, 0, 0]
@@ -198,7 +198,7 @@ class ContentTools:
                 x, y = 300.0, 200.0
             
             # Use modular AppleScript function
-            result = self.runner.run_function(
+            result = await self.runner.run_function_async(
                 script_file=self.script_files['addImage'],
                 function_name='addImage',
                 args=["", slide_number, image_path, x, y, 0, 0]
@@ -227,7 +227,7 @@ class ContentTools:
                 )]
             
             # Use theme-aware function
-            result = self.runner.run_function(
+            result = await self.runner.run_function_async(
                 script_file=self.script_files['setSlideContent'],
                 function_name='setSlideContent',
                 args=["", slide_number, title or "", body or ""]
@@ -255,7 +255,7 @@ class ContentTools:
         try:
             validate_slide_number(slide_number)
             
-            result = self.runner.run_function(
+            result = await self.runner.run_function_async(
                 script_file=self.script_files['getSlideDefaultElements'],
                 function_name='getSlideDefaultElements',
                 args=["", slide_number]
@@ -14,8 +14,8 @@ from pathlib import Path
 class ExportTools:
     """Export and screenshot tools class"""
     
-    def __init__(self):
-        self.runner = AppleScriptRunner()
+    def __init__(self, runner: Optional[AppleScriptRunner] = None):
+        self.runner = runner or AppleScriptRunner.instance()
     
     def get_tools(self) -> List[Tool]:
         """Get all export and screenshot tools"""
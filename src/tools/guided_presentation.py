@@ -2,17 +2,22 @@
 Guided Presentation Tools - Forces Claude Desktop to use analysis tools first
 """
 
+import asyncio
 from typing import Any, Dict, List, Optional
 from mcp.types import Tool, TextContent
-from ..utils import AppleScriptRunner
+from ..utils import AppleScriptRunner, KeynoteError
 import time
 
 
+# Seconds to wait for the layout list before answering without it
+_LAYOUTS_TIMEOUT = 2.0
+
+
 class GuidedPresentationTools:
     """Tools that guide Claude Desktop through a proper presentation creation workflow"""
     
-    def __init__(self):
-        self.runner = AppleScriptRunner()
+    def __init__(self, runner: Optional[AppleScriptRunner] = None):
+        self.runner = runner or AppleScriptRunner.instance()
         # Session state to track what Claude has done
         self.session_state = {
             'has_seen_layouts': False,
@@ -21,6 +26,25 @@ class GuidedPresentationTools:
             'slides_created_without_planning': 0,
             'presentation_name': None
         }
+        # Created on first use and kept, so their layout and slide count
+        # caches survive between calls
+        self._slide_tools = None
+        self._smart_tools = None
+    
+    def _get_slide_tools(self):
+        """Return the shared SlideTools, importing it on first use"""
+        if self._slide_tools is None:
+            from .slide import SlideTools
+            # The guided workflow reads the formatted messages, so it always asks for them
+            self._slide_tools = SlideTools(runner=self.runner, verbose=True)
+        return self._slide_tools
+    
+    def _get_smart_tools(self):
+        """Return the shared SmartLayoutTools, importing it on first use"""
+        if self._smart_tools is None:
+            from .smart_layout import SmartLayoutTools
+            self._smart_tools = SmartLayoutTools(runner=self.runner)
+        return self._smart_tools
     
     def get_tools(self) -> List[Tool]:
         """Get guided presentation workflow tools"""
@@ -191,15 +215,16 @@ Keynote offers various professional layouts designed for different content types
             
             # Check if we can access layouts (presentation exists)
             try:
-                from .slide import SlideTools
-                slide_tools = SlideTools()
-                layouts_result = await slide_tools.get_available_layouts()
+                slide_tools = self._get_slide_tools()
+                layouts_result = await asyncio.wait_for(
+                    slide_tools.get_available_layouts(), timeout=_LAYOUTS_TIMEOUT
+                )
                 if layouts_result and "📐 Available layouts:" in layouts_result[0].text:
                     response_text += "✅ **Presentation Ready**: You can now use `create_guided_slide` to start building.\n\n"
                     response_text += layouts_result[0].text
                 else:
                     response_text += "⚠️ **Next Step**: Create your presentation with `create_presentation`, then use `create_guided_slide`."
-            except:
+            except (KeynoteError, OSError, asyncio.TimeoutError):
                 response_text += "⚠️ **Next Step**: Create your presentation with `create_presentation`, then use `create_guided_slide`."
             
             return [TextContent(
@@ -291,8 +316,7 @@ Keynote offers various professional layouts designed for different content types
             # Get layout suggestion if not provided
             if not preferred_layout:
                 try:
-                    from .smart_layout import SmartLayoutTools
-                    smart_tools = SmartLayoutTools()
+                    smart_tools = self._get_smart_tools()
                     suggestion = await smart_tools.suggest_layout_for_content(content_type, content_description)
                     suggested_layout = suggestion[0].text.split(": ")[1] if ": " in suggestion[0].text else "Title & Bullets"
                 except:
@@ -311,8 +335,7 @@ Keynote offers various professional layouts designed for different content types
                 suggested_layout = preferred_layout
             
             # Create the slide using existing tools
-            from .slide import SlideTools
-            slide_tools = SlideTools()
+            slide_tools = self._get_slide_tools()
             
             result = await slide_tools.add_slide(
                 position=slide_number if slide_number > 0 else 0,
@@ -369,7 +392,7 @@ Keynote offers various professional layouts designed for different content types
             self.session_state['last_layout_check'] = time.time()
             
             from .layout_guidance import LayoutGuidanceTools
-            layout_tools = LayoutGuidanceTools()
+            layout_tools = LayoutGuidanceTools(runner=self.runner)
             
             recent_usage = await layout_tools.get_recent_layout_usage(last_n_slides=5, doc_name=doc_name)
             
@@ -409,8 +432,7 @@ Keynote offers various professional layouts designed for different content types
             elif any(word in content_description.lower() for word in ["gallery", "multiple", "several"]):
                 content_type = "gallery"
             
-            from .smart_layout import SmartLayoutTools
-            smart_tools = SmartLayoutTools()
+            smart_tools = self._get_smart_tools()
             
             suggestion = await smart_tools.suggest_layout_for_content(content_type, content_description)
             
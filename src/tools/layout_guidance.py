@@ -2,126 +2,218 @@
 Layout Guidance Tools - Help Claude Desktop make better layout decisions
 """
 
-from typing import Any, Dict, List, Optional
+import functools
+from typing import Any, Dict, List, Optional, Tuple
 from mcp.types import Tool, TextContent
 from ..utils import AppleScriptRunner
 
 
+# AppleScript files used by these tools, compiled up front
+_WARM_SCRIPTS = (
+    'layout_guidance.applescript',
+    'simple_layout_info.applescript',
+    'simple_recent_layouts.applescript',
+)
+
+# Content types understood by getContextualLayoutSuggestions
+_VALID_CONTENT_TYPES = frozenset({
+    "title", "image", "text", "content", "quote", "comparison",
+    "gallery", "bullets", "statement", "section",
+})
+
+# Type-specific tips for get_layout_variety_suggestions
+_TYPE_SECTIONS = {
+    "business": (
+        "**Business Presentation Tips:**\n"
+        "• Use Title & Bullets for key points\n"
+        "• Photo layouts for product showcases\n"
+        "• Statement layouts for key statistics\n"
+        "• Quote layouts for testimonials\n\n"
+    ),
+    "educational": (
+        "**Educational Presentation Tips:**\n"
+        "• Section layouts for chapter breaks\n"
+        "• Gallery layouts for examples\n"
+        "• Title & Bullets for structured learning\n"
+        "• Blank layouts for interactive content\n\n"
+    ),
+    "creative": (
+        "**Creative Presentation Tips:**\n"
+        "• Mix unconventional layouts\n"
+        "• Use Photo layouts for inspiration\n"
+        "• Blank layouts for custom designs\n"
+        "• Quote layouts for artistic statements\n\n"
+    ),
+}
+
+# Static text blocks are emitted as their own leading TextContent so that the
+# prefix of each tool result stays byte-identical across calls (prompt-cache
+# friendly); call-specific output follows in a second TextContent.
+
+# Heading and rules that open every layout variety guide
+_GOLDEN_RULES = (
+    "🎨 **Layout Variety Guide**\n\n"
+    "🎯 **Golden Rules:**\n"
+    "1. Never use the same layout more than 2 times in a row\n"
+    "2. Balance text-heavy and visual slides\n"
+    "3. Use transition slides (Section/Quote) to break up content\n"
+    "4. End with impact (Statement/Quote layout)\n"
+)
+
+# Tips returned with every detailed layout listing
+_LAYOUT_TIPS = (
+    "💡 **Tips for Better Presentations:**\n"
+    "• Avoid using the same layout more than 2 times in a row\n"
+    "• Mix text-heavy and visual layouts for better flow\n"
+    "• Use photo layouts for impact and engagement\n"
+    "• Section breaks help organize long presentations\n"
+    "• End with a powerful statement or quote layout"
+)
+
+# Error prefixes for the failure path of each tool
+_ERR_FAILED_INFO = "❌ Failed to get layout info: "
+_ERR_FAILED_SUGGESTIONS = "❌ Failed to get suggestions: "
+_ERR_FAILED_USAGE = "❌ Failed to get layout usage: "
+_ERR_FAILED_VARIETY = "❌ Failed to generate suggestions: "
+
+
+def _error_detail(e: Exception) -> str:
+    """Return the exception message, falling back to its class name"""
+    if e.args and isinstance(e.args[0], str):
+        return e.args[0]
+    return e.__class__.__name__
+
+
+def _text(text: str) -> List[TextContent]:
+    """Wrap a string in a single-item TextContent list"""
+    return [TextContent(type="text", text=text)]
+
+
+def _static_then_dynamic(static_text: str, dynamic_text: str) -> List[TextContent]:
+    """Return a cache-stable static block followed by call-specific output"""
+    return [
+        TextContent(type="text", text=static_text),
+        TextContent(type="text", text=dynamic_text)
+    ]
+
+
+@functools.lru_cache(maxsize=1)
+def _layout_guidance_tool_schemas() -> Tuple[Tool, ...]:
+    """Layout guidance tool schemas (built once; a tuple so the cached value can't be mutated)"""
+    return (
+        Tool(
+            name="get_detailed_layout_info",
+            description="Get comprehensive information about all available layouts with use cases and recommendations. The static tips block is returned first and is identical across calls.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "doc_name": {
+                        "type": "string",
+                        "description": "Document name (optional, uses front document if empty)"
+                    }
+                },
+                "required": []
+            }
+        ),
+        Tool(
+            name="get_contextual_layout_suggestions",
+            description="Get layout suggestions based on slide position, content type, and presentation context",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "slide_position": {
+                        "type": "integer",
+                        "description": "Position of the slide in the presentation (1-based)"
+                    },
+                    "content_type": {
+                        "type": "string",
+                        "description": "Type of content: 'title', 'image', 'text', 'quote', 'comparison', 'gallery', etc."
+                    },
+                    "content_description": {
+                        "type": "string",
+                        "description": "Brief description of the slide content"
+                    },
+                    "presentation_theme": {
+                        "type": "string",
+                        "description": "Overall theme or topic of the presentation (optional)"
+                    },
+                    "doc_name": {
+                        "type": "string",
+                        "description": "Document name (optional, uses front document if empty)"
+                    }
+                },
+                "required": ["slide_position", "content_type"]
+            }
+        ),
+        Tool(
+            name="get_recent_layout_usage",
+            description="Check which layouts were used in recent slides to help avoid repetition",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "last_n_slides": {
+                        "type": "integer",
+                        "description": "Number of recent slides to check (default: 5)"
+                    },
+                    "doc_name": {
+                        "type": "string",
+                        "description": "Document name (optional, uses front document if empty)"
+                    },
+                    "verdict_only": {
+                        "type": "boolean",
+                        "description": "Return only the repetition verdict (default: false)"
+                    }
+                },
+                "required": []
+            }
+        ),
+        Tool(
+            name="get_layout_variety_suggestions",
+            description="Get suggestions for creating varied and engaging presentations. The static golden rules block is returned first and is identical across calls.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "presentation_length": {
+                        "type": "integer",
+                        "description": "Total number of slides planned"
+                    },
+                    "presentation_type": {
+                        "type": "string",
+                        "description": "Type of presentation: 'business', 'educational', 'creative', 'technical'"
+                    }
+                },
+                "required": ["presentation_length"]
+            }
+        )
+    )
+
+
 class LayoutGuidanceTools:
     """Tools to help Claude Desktop choose appropriate layouts intelligently"""
     
-    def __init__(self):
-        self.runner = AppleScriptRunner()
+    def __init__(self, runner: Optional[AppleScriptRunner] = None):
+        self.runner = runner or AppleScriptRunner.instance()
         self.script_file = 'layout_guidance.applescript'
+        self.runner.precompile(*_WARM_SCRIPTS)
     
     def get_tools(self) -> List[Tool]:
         """Get all layout guidance tools"""
-        return [
-            Tool(
-                name="get_detailed_layout_info",
-                description="Get comprehensive information about all available layouts with use cases and recommendations",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "doc_name": {
-                            "type": "string",
-                            "description": "Document name (optional, uses front document if empty)"
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="get_contextual_layout_suggestions",
-                description="Get layout suggestions based on slide position, content type, and presentation context",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "slide_position": {
-                            "type": "integer",
-                            "description": "Position of the slide in the presentation (1-based)"
-                        },
-                        "content_type": {
-                            "type": "string",
-                            "description": "Type of content: 'title', 'image', 'text', 'quote', 'comparison', 'gallery', etc."
-                        },
-                        "content_description": {
-                            "type": "string",
-                            "description": "Brief description of the slide content"
-                        },
-                        "presentation_theme": {
-                            "type": "string",
-                            "description": "Overall theme or topic of the presentation (optional)"
-                        },
-                        "doc_name": {
-                            "type": "string",
-                            "description": "Document name (optional, uses front document if empty)"
-                        }
-                    },
-                    "required": ["slide_position", "content_type"]
-                }
-            ),
-            Tool(
-                name="get_recent_layout_usage",
-                description="Check which layouts were used in recent slides to help avoid repetition",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "last_n_slides": {
-                            "type": "integer",
-                            "description": "Number of recent slides to check (default: 5)"
-                        },
-                        "doc_name": {
-                            "type": "string",
-                            "description": "Document name (optional, uses front document if empty)"
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="get_layout_variety_suggestions",
-                description="Get suggestions for creating varied and engaging presentations",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "presentation_length": {
-                            "type": "integer",
-                            "description": "Total number of slides planned"
-                        },
-                        "presentation_type": {
-                            "type": "string",
-                            "description": "Type of presentation: 'business', 'educational', 'creative', 'technical'"
-                        }
-                    },
-                    "required": ["presentation_length"]
-                }
-            )
-        ]
+        return list(_layout_guidance_tool_schemas())
     
     async def get_detailed_layout_info(self, doc_name: str = "") -> List[TextContent]:
         """Get detailed information about all available layouts"""
         try:
-            result = self.runner.run_function(
+            result = await self.runner.run_function_async(
                 script_file='simple_layout_info.applescript',
                 function_name='getSimpleLayoutInfo',
                 args=[doc_name]
             )
             
             if result and result.strip():
-                info_text = "📐 **Available Layouts with Use Cases:**\n\n"
-                info_text += result
-                info_text += "\n\n💡 **Tips for Better Presentations:**\n"
-                info_text += "• Avoid using the same layout more than 2 times in a row\n"
-                info_text += "• Mix text-heavy and visual layouts for better flow\n"
-                info_text += "• Use photo layouts for impact and engagement\n"
-                info_text += "• Section breaks help organize long presentations\n"
-                info_text += "• End with a powerful statement or quote layout"
-                
-                return [TextContent(
-                    type="text",
-                    text=info_text
-                )]
+                return _static_then_dynamic(
+                    _LAYOUT_TIPS,
+                    "📐 **Available Layouts with Use Cases:**\n\n" + result
+                )
             else:
                 return [TextContent(
                     type="text",
@@ -129,15 +221,18 @@ class LayoutGuidanceTools:
                 )]
                 
         except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"❌ Failed to get layout info: {str(e)}"
-            )]
+            return _text(_ERR_FAILED_INFO + _error_detail(e))
     
     async def get_contextual_layout_suggestions(self, slide_position: int, content_type: str, content_description: str = "", presentation_theme: str = "", doc_name: str = "") -> List[TextContent]:
         """Get contextual layout suggestions"""
+        if content_type not in _VALID_CONTENT_TYPES:
+            return _text(
+                f"❌ Unknown content_type '{content_type}'. "
+                f"Valid types: {', '.join(sorted(_VALID_CONTENT_TYPES))}"
+            )
+        
         try:
-            result = self.runner.run_function(
+            result = await self.runner.run_function_async(
                 script_file=self.script_file,
                 function_name='getContextualLayoutSuggestions',
                 args=[doc_name, slide_position, content_type, content_description, presentation_theme]
@@ -163,42 +258,32 @@ class LayoutGuidanceTools:
                 )]
                 
         except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"❌ Failed to get suggestions: {str(e)}"
-            )]
+            return _text(_ERR_FAILED_SUGGESTIONS + _error_detail(e))
     
-    async def get_recent_layout_usage(self, last_n_slides: int = 5, doc_name: str = "") -> List[TextContent]:
+    async def get_recent_layout_usage(self, last_n_slides: int = 5, doc_name: str = "", verdict_only: bool = False) -> List[TextContent]:
         """Get recent layout usage to avoid repetition"""
         try:
-            result = self.runner.run_function(
+            result = await self.runner.run_function_async(
                 script_file='simple_recent_layouts.applescript',
                 function_name='getSimpleRecentLayouts',
                 args=[doc_name, last_n_slides]
             )
             
             if result and result.strip():
-                usage_text = f"📊 **Recent Layout Usage** (last {last_n_slides} slides):\n\n"
-                usage_text += result
-                
                 # Analyze for patterns
-                lines = result.split('\n')
-                layout_names = []
-                for line in lines:
-                    if ':' in line:
-                        layout_name = line.split(':')[1].strip()
-                        layout_names.append(layout_name)
+                layout_names = [
+                    line.split(':')[1].strip()
+                    for line in result.split('\n')
+                    if ':' in line
+                ]
+                verdict = self._variety_verdict(layout_names)
                 
-                # Check for repetition
-                unique_layouts = set(layout_names)
-                if len(unique_layouts) == 1 and len(layout_names) > 2:
-                    usage_text += f"\n⚠️ **Warning**: Same layout used {len(layout_names)} times in a row!"
-                    usage_text += "\n💡 **Suggestion**: Consider using a different layout for visual variety"
-                elif len(unique_layouts) < len(layout_names) / 2:
-                    usage_text += f"\n🔄 **Notice**: Limited layout variety detected"
-                    usage_text += "\n💡 **Suggestion**: Try mixing different layout types"
-                else:
-                    usage_text += f"\n✅ **Good**: Nice layout variety in recent slides"
+                if verdict_only:
+                    return _text(verdict)
+                
+                usage_text = f"📊 **Recent Layout Usage** (last {last_n_slides} slides):\n\n"
+                usage_text += result
+                usage_text += "\n" + verdict
                 
                 return [TextContent(
                     type="text",
@@ -211,15 +296,25 @@ class LayoutGuidanceTools:
                 )]
                 
         except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"❌ Failed to get layout usage: {str(e)}"
-            )]
+            return _text(_ERR_FAILED_USAGE + _error_detail(e))
+    
+    @staticmethod
+    def _variety_verdict(layout_names: List[str]) -> str:
+        """Classify recent layout usage as repetitive, limited, or varied"""
+        unique_layouts = set(layout_names)
+        if len(unique_layouts) == 1 and len(layout_names) > 2:
+            return (f"⚠️ **Warning**: Same layout used {len(layout_names)} times in a row!"
+                    "\n💡 **Suggestion**: Consider using a different layout for visual variety")
+        elif len(unique_layouts) < len(layout_names) / 2:
+            return ("🔄 **Notice**: Limited layout variety detected"
+                    "\n💡 **Suggestion**: Try mixing different layout types")
+        else:
+            return "✅ **Good**: Nice layout variety in recent slides"
     
     async def get_layout_variety_suggestions(self, presentation_length: int, presentation_type: str = "business") -> List[TextContent]:
         """Get suggestions for creating varied presentations"""
         try:
-            suggestions_text = f"🎨 **Layout Variety Guide** for {presentation_length}-slide {presentation_type} presentation:\n\n"
+            suggestions_text = f"📋 **Plan for a {presentation_length}-slide {presentation_type} presentation:**\n\n"
             
             # General guidelines based on presentation length
             if presentation_length <= 5:
@@ -245,40 +340,9 @@ class LayoutGuidanceTools:
                 suggestions_text += "• Alternate text-heavy and visual layouts\n\n"
             
             # Type-specific suggestions
-            if presentation_type == "business":
-                suggestions_text += "**Business Presentation Tips:**\n"
-                suggestions_text += "• Use Title & Bullets for key points\n"
-                suggestions_text += "• Photo layouts for product showcases\n"
-                suggestions_text += "• Statement layouts for key statistics\n"
-                suggestions_text += "• Quote layouts for testimonials\n\n"
-                
-            elif presentation_type == "educational":
-                suggestions_text += "**Educational Presentation Tips:**\n"
-                suggestions_text += "• Section layouts for chapter breaks\n"
-                suggestions_text += "• Gallery layouts for examples\n"
-                suggestions_text += "• Title & Bullets for structured learning\n"
-                suggestions_text += "• Blank layouts for interactive content\n\n"
-                
-            elif presentation_type == "creative":
-                suggestions_text += "**Creative Presentation Tips:**\n"
-                suggestions_text += "• Mix unconventional layouts\n"
-                suggestions_text += "• Use Photo layouts for inspiration\n"
-                suggestions_text += "• Blank layouts for custom designs\n"
-                suggestions_text += "• Quote layouts for artistic statements\n\n"
-            
-            suggestions_text += "🎯 **Golden Rules:**\n"
-            suggestions_text += "1. Never use the same layout more than 2 times in a row\n"
-            suggestions_text += "2. Balance text-heavy and visual slides\n"
-            suggestions_text += "3. Use transition slides (Section/Quote) to break up content\n"
-            suggestions_text += "4. End with impact (Statement/Quote layout)\n"
+            suggestions_text += _TYPE_SECTIONS.get(presentation_type, "")
             
-            return [TextContent(
-                type="text",
-                text=suggestions_text
-            )]
+            return _static_then_dynamic(_GOLDEN_RULES, suggestions_text)
             
         except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"❌ Failed to generate suggestions: {str(e)}"
-            )]
\ No newline at end of file
+            return _text(_ERR_FAILED_VARIETY + _error_detail(e))
\ No newline at end of file
@@ -2,16 +2,117 @@
 Presentation management tools
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import functools
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 from mcp.types import Tool, TextContent
-from ..utils import AppleScriptRunner, validate_file_path, KeynoteError
+from ..utils import AppleScriptRunner, validate_file_path, KeynoteError, FileOperationError
+from .slide.layout_operations import SlideLayoutOperations
+from .smart_layout import SmartLayoutTools
+
+logger = logging.getLogger(__name__)
+
+# Seconds a document metrics lookup stays fresh
+_METRICS_TTL = 0.5
+
+# File types Keynote can open (.key documents may be package directories)
+_OPENABLE_SUFFIXES = frozenset({".key", ".keynote", ".ppt", ".pptx"})
+
+# Seconds the open document list is reused; create/open/close reset it
+_DOCS_TTL = 1.0
+
+# Installed themes only change on app upgrade, so keep them for a while
+_THEMES_TTL = 300.0
+
+# Separates the parts of multi-part script results (ASCII record separator)
+_BATCH_SEP = "\x1e"
+
+# Joins name lists and record fields returned by scripts (ASCII unit separator)
+_LIST_SEP = "\x1f"
+
+# Batchable read tools and the request each one needs from runBatch
+_BATCH_REQUESTS = {
+    "get_presentation_info": "metrics",
+    "get_presentation_resolution": "metrics",
+    "get_slide_size": "metrics",
+    "list_presentations": "list",
+}
+
+
+# Aspect ratio bands (exclusive low, exclusive high, label)
+_RATIO_TABLE = (
+    (1.3, 1.4, "4:3"),
+    (1.7, 1.8, "16:9"),
+    (2.3, 2.4, "21:9"),
+    (0.55, 0.58, "9:16"),
+)
+
+
+def _ratio_type(aspect_ratio: float) -> str:
+    """Classify an aspect ratio using _RATIO_TABLE, or Custom if no band matches"""
+    for low, high, label in _RATIO_TABLE:
+        if low < aspect_ratio < high:
+            return label
+    return "Custom"
+
+
+@functools.lru_cache(maxsize=16)
+def _compute_resolution(width: str, height: str) -> str:
+    """Build the resolution report for a resolution (cached per width/height)"""
+    aspect_ratio = float(width) / float(height)
+    ratio_type = _ratio_type(aspect_ratio)
+    return f"📐 Presentation Resolution:\n• Width: {width} pixels\n• Height: {height} pixels\n• Ratio: {round(aspect_ratio, 3)} ({ratio_type})"
+
+
+@functools.lru_cache(maxsize=16)
+def _compute_layout(width: str, height: str) -> str:
+    """Build the slide size report for a resolution (cached per width/height)"""
+    width_num = float(width)
+    height_num = float(height)
+    ratio = width_num / height_num
+    ratio_type = _ratio_type(ratio)
+    
+    # Calculate safe area (leaving margins)
+    safe_width = int(width_num * 0.9)
+    safe_height = int(height_num * 0.9)
+    margin_x = int((width_num - safe_width) / 2)
+    margin_y = int((height_num - safe_height) / 2)
+    
+    # Calculate common positions
+    center_x = int(width_num / 2)
+    center_y = int(height_num / 2)
+    
+    return f"""📏 Slide Size Information:
+• Size: {width} × {height} pixels
+• Ratio: {ratio:.3f} ({ratio_type})
+• Center Point: ({center_x}, {center_y})
+
+📐 Layout Reference:
+• Safe Area: {safe_width} × {safe_height} pixels
+• Margins: {margin_x} × {margin_y} pixels
+• Title Area Suggestion: y = {margin_y} - {margin_y + 100}
+• Content Area Suggestion: y = {margin_y + 120} - {safe_height + margin_y}"""
 
 
 class PresentationTools:
     """Presentation management tools class"""
     
-    def __init__(self):
-        self.runner = AppleScriptRunner()
+    def __init__(self, runner: Optional[AppleScriptRunner] = None):
+        self.runner = runner or AppleScriptRunner.instance()
+        self.script_file = 'presentation_simple.applescript'
+        self.runner.precompile(self.script_file)
+        self._metrics_cache: Dict[str, Tuple[float, Tuple[str, str, str, str, str]]] = {}
+        self._themes_cache: Optional[List[str]] = None
+        self._themes_cache_ts: float = 0.0
+        self._themes_refresh: Optional[asyncio.Task] = None
+        self._themes_text: Optional[Tuple[List[str], str]] = None
+        self._docs_cache: Optional[Tuple[float, str]] = None
+        self._save_queue: Optional[asyncio.Queue] = None
+        self._save_worker: Optional[asyncio.Task] = None
     
     def get_tools(self) -> List[Tool]:
         """Get all presentation management tools"""
@@ -64,6 +165,10 @@ class PresentationTools:
                         "doc_name": {
                             "type": "string",
                             "description": "Document name (optional, defaults to current document)"
+                        },
+                        "wait": {
+                            "type": "boolean",
+                            "description": "Wait for the save to finish (default is true); when false the save is queued and the call returns immediately"
                         }
                     }
                 }
@@ -129,7 +234,12 @@ class PresentationTools:
                 description="🎨 THEME BROWSER: Get a complete list of available Keynote themes for professional presentation styling. Use this to discover theme options before creating a presentation or to switch themes on existing presentations. Each theme provides different color schemes, fonts, and layout styles.",
                 inputSchema={
                     "type": "object",
-                    "properties": {},
+                    "properties": {
+                        "refresh": {
+                            "type": "boolean",
+                            "description": "Re-read themes from Keynote instead of using the cached list (default is false)"
+                        }
+                    },
                     "additionalProperties": False
                 }
             ),
@@ -158,82 +268,86 @@ class PresentationTools:
                         }
                     }
                 }
+            ),
+            Tool(
+                name="batch_presentation_queries",
+                description="Run several presentation read queries in a single AppleScript call",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "calls": {
+                            "type": "array",
+                            "description": "Queries to run, in order",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "tool": {
+                                        "type": "string",
+                                        "enum": list(_BATCH_REQUESTS),
+                                        "description": "Tool to run"
+                                    },
+                                    "doc_name": {
+                                        "type": "string",
+                                        "description": "Document name (optional, defaults to current document)"
+                                    }
+                                },
+                                "required": ["tool"]
+                            }
+                        }
+                    },
+                    "required": ["calls"]
+                }
             )
         ]
     
     async def create_presentation(self, title: str, theme: str = "", template: str = "") -> List[TextContent]:
         """Create new presentation"""
         try:
-            # Ensure Keynote is running
-            if not self.runner.check_keynote_running():
-                self.runner.launch_keynote()
-            
-            # Use the simplified presentation script
-            result = self.runner.run_function(
-                script_file='presentation_simple.applescript',
-                function_name='createNewPresentation',
+            # Create the document and read its layouts in one script call
+            result = await self.runner.run_handler_async(
+                script_file=self.script_file,
+                function_name='createNewPresentationAndReturnLayouts',
                 args=[title, theme]
             )
+            self._docs_cache = None
+            result, _, layouts = result.partition(_BATCH_SEP)
+            layout_names = [layout.strip() for layout in layouts.split(_LIST_SEP) if layout.strip()]
             
-            # Now that presentation exists, get available layouts
-            try:
-                # Import here to avoid circular imports
-                from .slide import SlideTools
-                slide_tools = SlideTools()
-                layouts_result = await slide_tools.get_available_layouts()
-                layouts_text = layouts_result[0].text if layouts_result else ""
-                
-                # Parse layouts from the text for easier consumption by Claude Desktop
-                layout_names = []
-                if layouts_text:
-                    lines = layouts_text.split('\n')
-                    for line in lines:
-                        if line.strip().startswith('•'):
-                            layout_name = line.strip()[1:].strip()
-                            if layout_name:
-                                layout_names.append(layout_name)
-                
-                response_text = f"✅ Successfully created presentation: {result}\n\n"
+            response_text = f"✅ Successfully created presentation: {result}\n\n"
+            
+            # Enhanced layout information for Claude Desktop
+            if layout_names:
+                response_text += f"🎨 **Available Layouts ({len(layout_names)} total):**\n"
+                # Show first 8 layouts prominently
+                for i, layout in enumerate(layout_names[:8]):
+                    response_text += f"• **{layout}** - Use `add_slide` with layout=\"{layout}\"\n"
                 
-                # Enhanced layout information for Claude Desktop
-                if layout_names:
-                    response_text += f"🎨 **Available Layouts ({len(layout_names)} total):**\n"
-                    # Show first 8 layouts prominently
-                    for i, layout in enumerate(layout_names[:8]):
-                        response_text += f"• **{layout}** - Use `add_slide` with layout=\"{layout}\"\n"
-                    
-                    if len(layout_names) > 8:
-                        response_text += f"• ... and {len(layout_names) - 8} more layouts\n"
-                    
-                    response_text += "\n💡 **Layout Usage Tips:**\n"
-                    response_text += "• Mix different layouts to create visual variety\n"
-                    response_text += "• Use 'Title & Content' for standard slides\n"
-                    response_text += "• Use 'Title Only' for section dividers\n"
-                    response_text += "• Use 'Blank' for custom layouts\n\n"
-                    
-                    # Provide ready-to-use examples
-                    response_text += "🚀 **Quick Start Examples:**\n"
-                    if "Title & Content" in layout_names:
-                        response_text += f"• `add_slide` with layout=\"Title & Content\"\n"
-                    if "Title Only" in layout_names:
-                        response_text += f"• `add_slide` with layout=\"Title Only\"\n"
-                    if "Blank" in layout_names:
-                        response_text += f"• `add_slide` with layout=\"Blank\"\n"
-                else:
-                    response_text += layouts_text
+                if len(layout_names) > 8:
+                    response_text += f"• ... and {len(layout_names) - 8} more layouts\n"
                 
-                response_text += "\n🎯 **Ready for guided workflow!** Use `start_presentation_planning` to get layout guidance."
+                response_text += "\n💡 **Layout Usage Tips:**\n"
+                response_text += "• Mix different layouts to create visual variety\n"
+                response_text += "• Use 'Title & Content' for standard slides\n"
+                response_text += "• Use 'Title Only' for section dividers\n"
+                response_text += "• Use 'Blank' for custom layouts\n\n"
                 
-                return [TextContent(
-                    type="text",
-                    text=response_text
-                )]
-            except:
-                # Fallback if layouts can't be retrieved
-                return [TextContent(
-                    type="text",
-                    text=f"✅ Successfully created presentation: {result}\n\n🎯 **Ready for guided workflow!** Use `start_presentation_planning` to get layout guidance."
-                )]
+                # Provide ready-to-use examples
+                response_text += "🚀 **Quick Start Examples:**\n"
+                if "Title & Content" in layout_names:
+                    response_text += f"• `add_slide` with layout=\"Title & Content\"\n"
+                if "Title Only" in layout_names:
+                    response_text += f"• `add_slide` with layout=\"Title Only\"\n"
+                if "Blank" in layout_names:
+                    response_text += f"• `add_slide` with layout=\"Blank\"\n"
+            else:
+                response_text += "📐 No available layouts found\n"
+            
+            response_text += "\n🎯 **Ready for guided workflow!** Use `start_presentation_planning` to get layout guidance."
+            
+            return [TextContent(
+                type="text",
+                text=response_text
+            )]
             
         except Exception as e:
             return [TextContent(
@@ -244,19 +358,20 @@ class PresentationTools:
     async def open_presentation(self, file_path: str) -> List[TextContent]:
         """Open presentation"""
         try:
-            validate_file_path(file_path)
+            file_path = validate_file_path(file_path)
             
-            # Ensure Keynote is running
-            if not self.runner.check_keynote_running():
-                self.runner.launch_keynote()
+            # Reject bad paths before Keynote is involved
+            if Path(file_path).suffix.lower() not in _OPENABLE_SUFFIXES:
+                raise FileOperationError(f"Unsupported file type: {file_path}")
+            if not os.path.exists(file_path):
+                raise FileOperationError(f"File not found: {file_path}")
             
-            result = self.runner.run_inline_script(f'''
-                tell application "Keynote"
-                    set targetFile to POSIX file "{file_path}"
-                    open targetFile
-                    return name of front document
-                end tell
-            ''')
+            result = await self.runner.run_handler_async(
+                script_file=self.script_file,
+                function_name='openPresentation',
+                args=[file_path]
+            )
+            self._docs_cache = None
             
             return [TextContent(
                 type="text",
@@ -269,20 +384,35 @@ class PresentationTools:
                 text=f"❌ Failed to open presentation: {str(e)}"
             )]
     
-    async def save_presentation(self, doc_name: str = "") -> List[TextContent]:
+    async def save_presentation(self, doc_name: str = "", wait: bool = True) -> List[TextContent]:
         """Save presentation"""
+        if not wait:
+            try:
+                # Resolve the front document now; it may change before the save runs
+                if not doc_name:
+                    doc_name = await self.runner.run_handler_async(
+                        script_file=self.script_file,
+                        function_name='getFrontDocumentName',
+                        args=[]
+                    )
+            except Exception as e:
+                return [TextContent(
+                    type="text",
+                    text=f"❌ Failed to save presentation: {str(e)}"
+                )]
+            
+            self._queue_save(doc_name)
+            return [TextContent(
+                type="text",
+                text=f"⏳ Save queued for presentation: {doc_name}"
+            )]
+        
         try:
-            result = self.runner.run_inline_script(f'''
-                tell application "Keynote"
-                    if "{doc_name}" is "" then
-                        save front document
-                        return name of front document
-                    else
-                        save document "{doc_name}"
-                        return "{doc_name}"
-                    end if
-                end tell
-            ''')
+            result = await self.runner.run_handler_async(
+                script_file=self.script_file,
+                function_name='savePresentation',
+                args=[doc_name]
+            )
             
             return [TextContent(
                 type="text",
@@ -295,29 +425,53 @@ class PresentationTools:
                 text=f"❌ Failed to save presentation: {str(e)}"
             )]
     
+    def _queue_save(self, doc_name: str) -> None:
+        """Queue a background save, starting the save worker if needed"""
+        if self._save_queue is None:
+            self._save_queue = asyncio.Queue()
+        if self._save_worker is None or self._save_worker.done():
+            self._save_worker = asyncio.get_running_loop().create_task(self._drain_saves())
+        self._save_queue.put_nowait(doc_name)
+    
+    async def _drain_saves(self) -> None:
+        """Save queued documents, coalescing whatever is pending into one script"""
+        while True:
+            doc_names = [await self._save_queue.get()]
+            while not self._save_queue.empty():
+                doc_names.append(self._save_queue.get_nowait())
+            
+            try:
+                failed = await self.runner.run_handler_async(
+                    script_file=self.script_file,
+                    function_name='savePresentations',
+                    args=[_LIST_SEP.join(dict.fromkeys(doc_names))]
+                )
+                if failed:
+                    # Queued saves have no caller left to report to
+                    logger.warning("Queued save failed for: %s", ", ".join(failed.split(_LIST_SEP)))
+            except Exception as e:
+                logger.warning("Queued save failed for %s: %s", ", ".join(doc_names), e)
+            finally:
+                for _ in doc_names:
+                    self._save_queue.task_done()
+    
+    async def _flush_saves(self) -> None:
+        """Wait until every queued save has run"""
+        if self._save_queue is not None and self._save_worker is not None and not self._save_worker.done():
+            await self._save_queue.join()
+    
     async def close_presentation(self, doc_name: str = "", should_save: bool = True) -> List[TextContent]:
         """Close presentation"""
         try:
-            save_flag = "true" if should_save else "false"
+            # Let queued saves finish before the document goes away
+            await self._flush_saves()
             
-            result = self.runner.run_inline_script(f'''
-                tell application "Keynote"
-                    if "{doc_name}" is "" then
-                        set targetDoc to front document
-                    else
-                        set targetDoc to document "{doc_name}"
-                    end if
-                    
-                    set docName to name of targetDoc
-                    
-                    if {save_flag} then
-                        save targetDoc
-                    end if
-                    
-                    close targetDoc
-                    return docName
-                end tell
-            ''')
+            result = await self.runner.run_handler_async(
+                script_file=self.script_file,
+                function_name='closePresentation',
+                args=[doc_name, should_save]
+            )
+            self._docs_cache = None
             
             return [TextContent(
                 type="text",
@@ -333,28 +487,22 @@ class PresentationTools:
     async def list_presentations(self) -> List[TextContent]:
         """List all open presentations"""
         try:
-            result = self.runner.run_inline_script('''
-                tell application "Keynote"
-                    set docList to {}
-                    repeat with doc in documents
-                        set end of docList to name of doc
-                    end repeat
-                    return docList as string
-                end tell
-            ''')
+            # Without Keynote running there is nothing to list
+            if self.runner.keynote_running_hint() is False:
+                return self._format_presentation_list("")
             
-            if result:
-                presentations = result.replace("{", "").replace("}", "").split(", ")
-                presentation_list = "\n".join([f"• {name}" for name in presentations])
-                return [TextContent(
-                    type="text",
-                    text=f"📋 Open presentations:\n{presentation_list}"
-                )]
-            else:
-                return [TextContent(
-                    type="text",
-                    text="📋 No presentations currently open"
-                )]
+            # Bursts of state checks reuse the list fetched moments ago
+            if self._docs_cache is not None and time.monotonic() - self._docs_cache[0] < _DOCS_TTL:
+                return self._format_presentation_list(self._docs_cache[1])
+            
+            result = await self.runner.run_handler_async(
+                script_file=self.script_file,
+                function_name='listPresentations',
+                args=[]
+            )
+            self._docs_cache = (time.monotonic(), result)
+            
+            return self._format_presentation_list(result)
                 
         except Exception as e:
             return [TextContent(
@@ -362,42 +510,44 @@ class PresentationTools:
                 text=f"❌ Failed to get presentation list: {str(e)}"
             )]
     
+    @staticmethod
+    def _format_presentation_list(result: str) -> List[TextContent]:
+        """Format a document name list joined with _LIST_SEP"""
+        if result:
+            presentations = result.split(_LIST_SEP)
+            presentation_list = "\n".join([f"• {name}" for name in presentations])
+            return [TextContent(
+                type="text",
+                text=f"📋 Open presentations:\n{presentation_list}"
+            )]
+        else:
+            return [TextContent(
+                type="text",
+                text="📋 No presentations currently open"
+            )]
+    
     async def set_presentation_theme(self, theme_name: str, doc_name: str = "") -> List[TextContent]:
         """Set presentation theme"""
         try:
-            # Use Keynote 14 compatible theme setting method
-            result = self.runner.run_inline_script(f'''
-                tell application "Keynote"
-                    if "{doc_name}" is "" then
-                        set targetDoc to front document
-                    else
-                        set targetDoc to document "{doc_name}"
-                    end if
-                    
-                    -- First check if theme exists
-                    set themeExists to false
-                    repeat with t in themes
-                        if name of t is "{theme_name}" then
-                            set themeExists to true
-                            exit repeat
-                        end if
-                    end repeat
-                    
-                    if not themeExists then
-                        return "theme_not_found"
-                    end if
-                    
-                    -- Use document theme property to set theme
-                    try
-                        set document theme of targetDoc to theme "{theme_name}"
-                        return "success"
-                    on error errMsg
-                        return "error: " & errMsg
-                    end try
-                end tell
-            ''')
+            # A fresh theme list can reject unknown names without a script call;
+            # Keynote looks themes up case-insensitively, so compare the same way
+            if (self._themes_cache
+                    and time.monotonic() - self._themes_cache_ts < _THEMES_TTL
+                    and theme_name.casefold() not in {theme.casefold() for theme in self._themes_cache}):
+                result = "theme_not_found"
+            else:
+                result = await self.runner.run_handler_async(
+                    script_file=self.script_file,
+                    function_name='setPresentationTheme',
+                    args=[doc_name, theme_name]
+                )
             
             if result == "success":
+                self._metrics_cache.clear()
+                # The new theme brings its own masters; without a name the
+                # front document may be cached under any name, so drop them all
+                SlideLayoutOperations.invalidate_layouts_cache(doc_name)
+                SmartLayoutTools.invalidate_master_cache(doc_name)
                 return [TextContent(
                     type="text",
                     text=f"✅ Successfully set theme: {theme_name}"
@@ -422,40 +572,11 @@ class PresentationTools:
     async def get_presentation_info(self, doc_name: str = "") -> List[TextContent]:
         """Get presentation information"""
         try:
-            result = self.runner.run_inline_script(f'''
-                tell application "Keynote"
-                    if "{doc_name}" is "" then
-                        set targetDoc to front document
-                    else
-                        set targetDoc to document "{doc_name}"
-                    end if
-                    
-                    set docInfo to {{}}
-                    set end of docInfo to name of targetDoc
-                    set end of docInfo to count of slides of targetDoc
-                    
-                    try
-                        set end of docInfo to name of theme of targetDoc
-                    on error
-                        set end of docInfo to "Unknown Theme"
-                    end try
-                    
-                    return docInfo as string
-                end tell
-            ''')
-            
-            info_parts = result.replace("{", "").replace("}", "").split(", ")
-            if len(info_parts) >= 3:
-                name, slide_count, theme = info_parts[0], info_parts[1], info_parts[2]
-                return [TextContent(
-                    type="text",
-                    text=f"📊 Presentation Information:\n• Name: {name}\n• Slide Count: {slide_count}\n• Theme: {theme}"
-                )]
-            else:
-                return [TextContent(
-                    type="text",
-                    text=f"📊 Presentation Information: {result}"
-                )]
+            name, slide_count, theme, _, _ = await self._fetch_doc_metrics(doc_name)
+            return [TextContent(
+                type="text",
+                text=f"📊 Presentation Information:\n• Name: {name}\n• Slide Count: {slide_count}\n• Theme: {theme}"
+            )]
                 
         except Exception as e:
             return [TextContent(
@@ -463,36 +584,24 @@ class PresentationTools:
                 text=f"❌ Failed to get presentation information: {str(e)}"
             )]
     
-    async def get_available_themes(self) -> List[TextContent]:
+    async def get_available_themes(self, refresh: bool = False) -> List[TextContent]:
         """Get available themes list"""
         try:
-            # Use the simplified presentation script
-            result = self.runner.run_function(
-                script_file='presentation_simple.applescript',
-                function_name='getAvailableThemes',
-                args=[]
-            )
+            themes = await self._get_theme_names(refresh)
             
-            if result:
-                # Parse the AppleScript list result
-                themes = result.replace("{", "").replace("}", "").split(", ")
-                themes = [theme.strip('"') for theme in themes if theme.strip()]
-                
-                if themes:
+            if themes:
+                # The list object only changes on reload, so format it once per load
+                if self._themes_text is None or self._themes_text[0] is not themes:
                     theme_list = "\n".join([f"• {theme}" for theme in themes])
-                    return [TextContent(
-                        type="text",
-                        text=f"🎨 Available themes ({len(themes)}):\n{theme_list}"
-                    )]
-                else:
-                    return [TextContent(
-                        type="text",
-                        text="🎨 No themes found"
-                    )]
+                    self._themes_text = (themes, f"🎨 Available themes ({len(themes)}):\n{theme_list}")
+                return [TextContent(
+                    type="text",
+                    text=self._themes_text[1]
+                )]
             else:
                 return [TextContent(
                     type="text",
-                    text="🎨 Could not retrieve themes"
+                    text="🎨 No themes found"
                 )]
                 
         except Exception as e:
@@ -501,56 +610,56 @@ class PresentationTools:
                 text=f"❌ Failed to get themes list: {str(e)}"
             )]
     
+    async def _get_theme_names(self, refresh: bool = False) -> List[str]:
+        """
+        Return installed theme names, served from memory while fresh
+        
+        Once the TTL has passed the stale list is still returned and a
+        background refresh is scheduled (stale-while-revalidate).
+        """
+        if not refresh and self._themes_cache:
+            if time.monotonic() - self._themes_cache_ts >= _THEMES_TTL:
+                self._schedule_themes_refresh()
+            return self._themes_cache
+        
+        return await self._load_theme_names()
+    
+    def _schedule_themes_refresh(self) -> None:
+        """Refresh the theme list in the background if not already doing so"""
+        if self._themes_refresh is not None and not self._themes_refresh.done():
+            return
+        
+        async def refresh() -> None:
+            try:
+                await self._load_theme_names()
+            except Exception:
+                # Keep serving the stale list; the next expiry retries
+                pass
+        
+        self._themes_refresh = asyncio.get_running_loop().create_task(refresh())
+    
+    async def _load_theme_names(self) -> List[str]:
+        """Fetch installed theme names from Keynote and cache them"""
+        result = await self.runner.run_handler_async(
+            script_file=self.script_file,
+            function_name='getAvailableThemes',
+            args=[]
+        )
+        
+        themes = [theme for theme in result.split(_LIST_SEP) if theme]
+        self._themes_cache = themes
+        self._themes_cache_ts = time.monotonic()
+        return themes
+    
     async def get_presentation_resolution(self, doc_name: str = "") -> List[TextContent]:
         """Get presentation resolution"""
         try:
-            result = self.runner.run_inline_script(f'''
-                tell application "Keynote"
-                    if "{doc_name}" is "" then
-                        set targetDoc to front document
-                    else
-                        set targetDoc to document "{doc_name}"
-                    end if
-                    
-                    try
-                        set docWidth to width of targetDoc
-                        set docHeight to height of targetDoc
-                        
-                        set AppleScript's text item delimiters to ","
-                        set resolution to {{docWidth, docHeight}} as string
-                        set AppleScript's text item delimiters to ""
-                        
-                        return resolution
-                    on error
-                        -- Return standard 16:9 resolution
-                        return "1920,1080"
-                    end try
-                end tell
-            ''')
+            width, height = await self._get_doc_dimensions(doc_name)
             
-            # Parse result
-            resolution_parts = result.split(",")
-            if len(resolution_parts) >= 2:
-                width, height = resolution_parts[0], resolution_parts[1]
-                aspect_ratio = round(float(width) / float(height), 3)
-                
-                # Determine ratio type
-                if 1.7 < aspect_ratio < 1.8:
-                    ratio_type = "16:9"
-                elif 1.3 < aspect_ratio < 1.4:
-                    ratio_type = "4:3"
-                else:
-                    ratio_type = "Custom"
-                
-                return [TextContent(
-                    type="text",
-                    text=f"📐 Presentation Resolution:\n• Width: {width} pixels\n• Height: {height} pixels\n• Ratio: {aspect_ratio} ({ratio_type})"
-                )]
-            else:
-                return [TextContent(
-                    type="text",
-                    text=f"📐 Resolution Information: {result}"
-                )]
+            return [TextContent(
+                type="text",
+                text=_compute_resolution(width, height)
+            )]
                 
         except Exception as e:
             return [TextContent(
@@ -561,83 +670,128 @@ class PresentationTools:
     async def get_slide_size(self, doc_name: str = "") -> List[TextContent]:
         """Get slide size and aspect ratio information"""
         try:
-            result = self.runner.run_inline_script(f'''
-                tell application "Keynote"
-                    if "{doc_name}" is "" then
-                        set targetDoc to front document
-                    else
-                        set targetDoc to document "{doc_name}"
-                    end if
-                    
-                    try
-                        set slideWidth to width of targetDoc
-                        set slideHeight to height of targetDoc
-                        set aspectRatio to slideWidth / slideHeight
-                        
-                        -- Determine ratio type
-                        set ratioType to ""
-                        if aspectRatio > 1.7 and aspectRatio < 1.8 then
-                            set ratioType to "16:9"
-                        else if aspectRatio > 1.3 and aspectRatio < 1.4 then
-                            set ratioType to "4:3"
-                        else
-                            set ratioType to "Custom"
-                        end if
-                        
-                        set AppleScript's text item delimiters to ","
-                        set sizeInfo to {{slideWidth, slideHeight, aspectRatio, ratioType}} as string
-                        set AppleScript's text item delimiters to ""
-                        
-                        return sizeInfo
-                    on error
-                        -- Return default values
-                        return "1920,1080,1.777,16:9"
-                    end try
-                end tell
-            ''')
+            width, height = await self._get_doc_dimensions(doc_name)
             
-            # Parse result
-            size_parts = result.split(",")
-            if len(size_parts) >= 4:
-                width, height, ratio, ratio_type = size_parts[0], size_parts[1], size_parts[2], size_parts[3]
-                
-                # Calculate useful layout information
-                width_num = float(width)
-                height_num = float(height)
-                
-                # Calculate safe area (leaving margins)
-                safe_width = int(width_num * 0.9)
-                safe_height = int(height_num * 0.9)
-                margin_x = int((width_num - safe_width) / 2)
-                margin_y = int((height_num - safe_height) / 2)
-                
-                # Calculate common positions
-                center_x = int(width_num / 2)
-                center_y = int(height_num / 2)
-                
-                layout_info = f"""📏 Slide Size Information:
-• Size: {width} × {height} pixels
-• Ratio: {float(ratio):.3f} ({ratio_type})
-• Center Point: ({center_x}, {center_y})
-
-📐 Layout Reference:
-• Safe Area: {safe_width} × {safe_height} pixels
-• Margins: {margin_x} × {margin_y} pixels
-• Title Area Suggestion: y = {margin_y} - {margin_y + 100}
-• Content Area Suggestion: y = {margin_y + 120} - {safe_height + margin_y}"""
-                
-                return [TextContent(
-                    type="text",
-                    text=layout_info
-                )]
-            else:
-                return [TextContent(
-                    type="text",
-                    text=f"📏 Size Information: {result}"
-                )]
+            layout_info = _compute_layout(width, height)
+            
+            return [TextContent(
+                type="text",
+                text=layout_info
+            )]
                 
         except Exception as e:
             return [TextContent(
                 type="text",
                 text=f"❌ Failed to get slide size: {str(e)}"
-            )] 
\ No newline at end of file
+            )]
+    
+    async def run_batch(self, calls: List[Dict[str, Any]]) -> List[TextContent]:
+        """Run several read queries through one runBatch AppleScript call"""
+        unsupported = [call.get("tool") for call in calls if call.get("tool") not in _BATCH_REQUESTS]
+        if unsupported:
+            return [TextContent(
+                type="text",
+                text=f"❌ Unsupported batch tools: {', '.join(map(str, unsupported))}"
+            )]
+        
+        if not calls:
+            return []
+        
+        # Each document's metrics and the document list are fetched at most once
+        requests: List[str] = []
+        for call in calls:
+            kind = _BATCH_REQUESTS[call["tool"]]
+            request = f"{kind}{_LIST_SEP}{call.get('doc_name', '')}" if kind == "metrics" else f"list{_LIST_SEP}"
+            if request not in requests:
+                requests.append(request)
+        
+        try:
+            result = await self.runner.run_handler_async(
+                script_file=self.script_file,
+                function_name='runBatch',
+                args=[_BATCH_SEP.join(requests)]
+            )
+        except Exception as e:
+            return [TextContent(
+                type="text",
+                text=f"❌ Failed to run batch: {str(e)}"
+            )]
+        
+        # The runner strips the output and str.strip() treats the separator
+        # as whitespace, so drop the guard prefix and restore trimmed slots
+        parts = result[len("batch:"):].split(_BATCH_SEP)
+        parts += [""] * (len(requests) - len(parts))
+        responses = dict(zip(requests, parts))
+        
+        # Prime the metrics cache so the per-tool formatters below reuse it
+        now = time.monotonic()
+        for request, response in responses.items():
+            kind, doc_name = request.split(_LIST_SEP, 1)
+            if kind == "metrics" and not response.startswith("error: "):
+                fields = response.split(_LIST_SEP)
+                if len(fields) == 5:
+                    self._metrics_cache[doc_name] = (now, tuple(fields))
+        
+        contents: List[TextContent] = []
+        for call in calls:
+            tool = call["tool"]
+            if tool == "list_presentations":
+                response = responses.get(f"list{_LIST_SEP}", "")
+                if response.startswith("error: "):
+                    contents.append(TextContent(
+                        type="text",
+                        text=f"❌ Failed to get presentation list: {response[len('error: '):]}"
+                    ))
+                else:
+                    contents.extend(self._format_presentation_list(response))
+            else:
+                contents.extend(await getattr(self, tool)(doc_name=call.get("doc_name", "")))
+        
+        return contents
+    
+    async def _fetch_doc_metrics(self, doc_name: str) -> Tuple[str, str, str, str, str]:
+        """
+        Fetch name, slide count, theme, width and height in one round-trip
+        
+        Results are cached briefly per document so back-to-back info, resolution
+        and size queries share a single AppleScript call.
+        """
+        cached = self._metrics_cache.get(doc_name)
+        if cached is not None and time.monotonic() - cached[0] < _METRICS_TTL:
+            return cached[1]
+        
+        result = await self.runner.run_handler_async(
+            script_file=self.script_file,
+            function_name='getDocumentMetrics',
+            args=[doc_name]
+        )
+        
+        # The handler always returns exactly five fields, falling back to
+        # defaults for the theme and size, so the result unpacks directly
+        name, slide_count, theme, width, height = result.split(_LIST_SEP, 4)
+        
+        metrics = (name, slide_count, theme, width, height)
+        self._metrics_cache[doc_name] = (time.monotonic(), metrics)
+        return metrics
+    
+    async def _get_doc_dimensions(self, doc_name: str) -> Tuple[str, str]:
+        """
+        Return a document's width and height
+        
+        Fresh cached metrics are reused; otherwise only the dimensions are
+        queried, skipping the slide count and theme lookups.
+        """
+        cached = self._metrics_cache.get(doc_name)
+        if cached is not None and time.monotonic() - cached[0] < _METRICS_TTL:
+            return cached[1][3], cached[1][4]
+        
+        result = await self.runner.run_handler_async(
+            script_file=self.script_file,
+            function_name='getDocumentDimensions',
+            args=[doc_name]
+        )
+        
+        width, sep, height = result.partition(_LIST_SEP)
+        if not sep:
+            raise KeynoteError(f"Unexpected document dimensions: {result}")
+        return width, height
@@ -2,7 +2,8 @@
 Main SlideTools class that integrates all slide operations
 """
 
-from typing import List
+import os
+from typing import Any, Dict, List, Optional
 from mcp.types import Tool, TextContent
 from ...utils import AppleScriptRunner
 
@@ -12,20 +13,27 @@ from .navigation_operations import SlideNavigationOperations
 from .layout_operations import SlideLayoutOperations
 
 
+# Set to return bare values (slide numbers, JSON lists) instead of formatted messages
+_COMPACT_RESULTS_ENV = 'KEYNOTE_MCP_COMPACT_RESULTS'
+
+
 class SlideTools:
     """Slide operation tools class - Modular version"""
     
-    def __init__(self):
-        self.runner = AppleScriptRunner()
+    def __init__(self, runner: Optional[AppleScriptRunner] = None, verbose: Optional[bool] = None):
+        self.runner = runner or AppleScriptRunner.instance()
+        self.runner.precompile('slide.applescript')
+        if verbose is None:
+            verbose = not os.environ.get(_COMPACT_RESULTS_ENV)
         
         # Initialize operation modules
-        self.basic_ops = SlideBasicOperations(self.runner)
-        self.navigation_ops = SlideNavigationOperations(self.runner)
-        self.layout_ops = SlideLayoutOperations(self.runner)
+        self.layout_ops = SlideLayoutOperations(self.runner, verbose)
+        self.navigation_ops = SlideNavigationOperations(self.runner, verbose)
+        self.basic_ops = SlideBasicOperations(self.runner, self.layout_ops, self.navigation_ops, verbose)
     
     def get_tools(self) -> List[Tool]:
         """Get all slide operation tools"""
-        return get_slide_tool_schemas()
+        return list(get_slide_tool_schemas())
     
     # Basic operations
     async def add_slide(self, doc_name: str = "", position: int = 0, layout: str = "", clear_default_content: bool = True, content_type: str = "", content_description: str = "") -> List[TextContent]:
@@ -44,6 +52,14 @@ class SlideTools:
         """Move slide position"""
         return await self.basic_ops.move_slide(from_position, to_position, doc_name)
     
+    async def add_slides(self, specs: List[Dict[str, Any]]) -> List[TextContent]:
+        """Add several order-independent slides concurrently"""
+        return await self.basic_ops.add_slides(specs)
+    
+    async def bulk_slide_operations(self, operations: List[Dict[str, Any]]) -> List[TextContent]:
+        """Run several slide operations in one script execution"""
+        return await self.basic_ops.bulk(operations)
+    
     # Navigation operations
     async def get_slide_count(self, doc_name: str = "") -> List[TextContent]:
         """Get slide count"""
@@ -57,10 +73,16 @@ class SlideTools:
         """Get slide information"""
         return await self.navigation_ops.get_slide_info(slide_number, doc_name)
     
+    async def get_all_slide_info(self, doc_name: str = "") -> List[TextContent]:
+        """Get information about every slide"""
+        return await self.navigation_ops.get_all_slide_info(doc_name)
+    
     # Layout operations
     async def set_slide_layout(self, slide_number: int, layout: str, doc_name: str = "") -> List[TextContent]:
         """Set slide layout"""
-        return await self.layout_ops.set_slide_layout(slide_number, layout, doc_name)
+        result = await self.layout_ops.set_slide_layout(slide_number, layout, doc_name)
+        self.navigation_ops.invalidate_slide_info(doc_name)
+        return result
     
     async def get_available_layouts(self, doc_name: str = "") -> List[TextContent]:
         """Get available layout list"""
@@ -2,110 +2,86 @@
 Basic slide CRUD operations
 """
 
-from typing import List
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
 from mcp.types import TextContent
-from ...utils import AppleScriptRunner, validate_slide_number
+from ...utils import AppleScriptRunner, ParameterError, applescript_string, validate_slide_number
+from .layout_operations import SlideLayoutOperations
+from .navigation_operations import SlideNavigationOperations
+from ..smart_layout import suggest_layout
+
+
+# Layouts given as these numbers are applied by position in the layout list
+_INDEXED_LAYOUTS = {"1", "2", "3", "4", "5"}
+
+# Fixed parts of the add-slide script, built once at import
+_SET_LAYOUT_BY_NAME = '''
+                        set base slide of newSlide to master slide chosenLayout of targetDoc'''
+
+_LAYOUT_FALLBACK = '''
+                    on error
+                        -- Fallback to layout 2 (Title & Content)
+                        try
+                            set masterSlides to slide layouts of targetDoc
+                            if (count of masterSlides) ≥ 2 then
+                                set base slide of newSlide to item 2 of masterSlides
+                                log "Using default Title & Content layout"
+                            end if
+                        on error
+                            log "Could not set any layout, using document default"
+                        end try
+                    end try'''
+
+
+def _target_doc(doc_name: str) -> str:
+    """AppleScript line binding targetDoc, with the document name quoted for AppleScript"""
+    if doc_name:
+        return f"set targetDoc to document {applescript_string(doc_name)}"
+    return "set targetDoc to front document"
 
 
 class SlideBasicOperations:
     """Basic slide operations like add, delete, duplicate, move"""
     
-    def __init__(self, runner: AppleScriptRunner):
+    def __init__(self, runner: AppleScriptRunner, layout_ops: Optional[SlideLayoutOperations] = None, navigation_ops: Optional[SlideNavigationOperations] = None, verbose: bool = True):
         self.runner = runner
+        # When False, successful results are returned as bare values for programmatic clients
+        self.verbose = verbose
+        # Shares the per-document layout cache so smart layouts can be chosen locally
+        self.layout_ops = layout_ops or SlideLayoutOperations(runner)
+        # Shares the slide count cache so writes keep it current
+        self.navigation_ops = navigation_ops or SlideNavigationOperations(runner)
     
     async def add_slide(self, doc_name: str = "", position: int = 0, layout: str = "", clear_default_content: bool = True, content_type: str = "", content_description: str = "") -> List[TextContent]:
         """Add new slide"""
         try:
-            # If content_type is provided and no layout specified, use smart layout
-            if content_type and layout == "":
-                try:
-                    # Try to use smart layout based on content type
-                    from ...tools.smart_layout import SmartLayoutTools
-                    smart_layout = SmartLayoutTools()
-                    suggestion_result = smart_layout.runner.run_function(
-                        script_file='smart_layout.applescript',
-                        function_name='suggestLayoutForContent',
-                        args=[doc_name, content_type, ""]
-                    )
-                    
-                    if suggestion_result and suggestion_result.strip():
-                        layout = suggestion_result.strip()
-                    else:
-                        layout = "2"  # Fallback to Title & Content
-                except Exception:
-                    layout = "2"  # Fallback to Title & Content if smart layout fails
-            elif layout == "":
+            smart = bool(content_type) and layout == ""
+            if smart:
+                cached_layouts = self.layout_ops.cached_layout_names(doc_name)
+                if cached_layouts:
+                    layout = suggest_layout(cached_layouts, content_type)
+                    smart = False
+            if layout == "" and not smart:
                 layout = "2"  # Layout 2 is typically Title & Content
             
-            result = self.runner.run_inline_script(f'''
-                tell application "Keynote"
-                    activate
-                    if "{doc_name}" is "" then
-                        set targetDoc to front document
-                    else
-                        set targetDoc to document "{doc_name}"
-                    end if
-                    
-                    if {position} is 0 then
-                        set newSlide to make new slide at end of slides of targetDoc
-                    else
-                        set newSlide to make new slide at slide {position} of targetDoc
-                    end if
-                    
-                    if "{layout}" is not "" then
-                        try
-                            -- Try to use layout by number first (more reliable)
-                            if "{layout}" is "1" or "{layout}" is "2" or "{layout}" is "3" or "{layout}" is "4" or "{layout}" is "5" then
-                                set layoutNumber to {layout} as integer
-                                set masterSlides to slide layouts of targetDoc
-                                if layoutNumber ≤ (count of masterSlides) then
-                                    set base slide of newSlide to item layoutNumber of masterSlides
-                                else
-                                    -- Fallback to layout 2 (Title & Content)
-                                    set base slide of newSlide to item 2 of masterSlides
-                                end if
-                            else
-                                -- Try to use layout by name
-                                set base slide of newSlide to master slide "{layout}" of targetDoc
-                            end if
-                        on error
-                            -- Fallback to layout 2 (Title & Content)
-                            try
-                                set masterSlides to slide layouts of targetDoc
-                                if (count of masterSlides) ≥ 2 then
-                                    set base slide of newSlide to item 2 of masterSlides
-                                    log "Using default Title & Content layout"
-                                end if
-                            on error
-                                log "Could not set any layout, using document default"
-                            end try
-                        end try
-                    end if
-                    
-                    return slide number of newSlide
-                end tell
-            ''')
-            
-            # Set presenter notes for image/photo content types when using smart layout
+            # Image content gets a presenter note describing the suggested image,
+            # set by the same script that adds the slide
+            presenter_notes = ""
             if content_type in ["image", "photo", "gallery", "multiple_images"] and content_description:
-                try:
-                    # Escape quotes in content description
-                    escaped_description = content_description.replace('"', '\\"')
-                    self.runner.run_inline_script(f'''
-                        tell application "Keynote"
-                            if "{doc_name}" is "" then
-                                set targetDoc to front document
-                            else
-                                set targetDoc to document "{doc_name}"
-                            end if
-                            
-                            set targetSlide to slide {result} of targetDoc
-                            set presenter notes of targetSlide to "Image suggestion: {escaped_description}"
-                        end tell
-                    ''')
-                except Exception:
-                    # Ignore errors setting presenter notes
-                    pass
+                presenter_notes = f"Image suggestion: {content_description}"
+            
+            # The smart layout handlers ride along in the same script, so the
+            # suggestion and the insert share one execution
+            prelude = self.runner.read_script('smart_layout.applescript') if smart else ""
+            result = await self.runner.run_inline_script_async(
+                prelude + "\n\n" + self._add_slide_script(doc_name, position, layout, content_type if smart else "", presenter_notes)
+            )
+            result, _, layout = result.partition("\x1e")
+            self.navigation_ops.adjust_slide_count(doc_name, 1)
+            
+            if not self.verbose:
+                return [TextContent(type="text", text=result)]
             
             # Prepare layout and notes info
             notes_info = ""
@@ -132,22 +108,101 @@ class SlideBasicOperations:
                 text=f"❌ Failed to add slide: {str(e)}"
             )]
     
+    async def add_slides(self, specs: List[Dict[str, Any]]) -> List[TextContent]:
+        """
+        Add several slides concurrently
+        
+        Each spec holds add_slide's keyword arguments. The scripts are issued
+        together so one script's startup overlaps the previous one's Apple
+        Events, but they may finish in any order: only use this when order
+        does not matter, e.g. all appends with the same layout. Use bulk()
+        for ordered sequences.
+        """
+        results = await asyncio.gather(*[self.add_slide(**spec) for spec in specs])
+        return [TextContent(
+            type="text",
+            text=f"📦 Added {len(specs)} slides:\n" + "\n".join(result[0].text for result in results)
+        )]
+    
+    @staticmethod
+    def _add_slide_script(doc_name: str, position: int, layout: str, smart_content_type: str = "", presenter_notes: str = "") -> str:
+        """
+        AppleScript body that adds a slide and returns its number and layout
+        
+        With smart_content_type set, the layout comes from smart_layout.applescript's
+        suggestLayoutForContent, which must be included in the same script.
+        Non-empty presenter_notes are set on the new slide, ignoring failures.
+        """
+        if smart_content_type:
+            choose_layout = f'''
+                set chosenLayout to ""
+                try
+                    set chosenLayout to my suggestLayoutForContent({applescript_string(doc_name)}, {applescript_string(smart_content_type)}, "")
+                end try
+                if chosenLayout is "" then set chosenLayout to "2"'''
+        else:
+            choose_layout = f'''
+                set chosenLayout to {applescript_string(layout)}'''
+        
+        if position == 0:
+            make_slide = "set newSlide to make new slide at end of slides of targetDoc"
+        else:
+            make_slide = f"set newSlide to make new slide at slide {position} of targetDoc"
+        
+        # The branch is picked here, where the layout is known, so the
+        # script only carries the lookup it needs
+        if layout in _INDEXED_LAYOUTS and not smart_content_type:
+            # Layout numbers are more reliable than names
+            set_layout = f'''
+                        set masterSlides to slide layouts of targetDoc
+                        if {layout} ≤ (count of masterSlides) then
+                            set base slide of newSlide to item {layout} of masterSlides
+                        else
+                            -- Fallback to layout 2 (Title & Content)
+                            set base slide of newSlide to item 2 of masterSlides
+                        end if'''
+        else:
+            set_layout = _SET_LAYOUT_BY_NAME
+        
+        apply_layout = ""
+        if layout or smart_content_type:
+            apply_layout = "try" + set_layout + _LAYOUT_FALLBACK
+        
+        set_notes = ""
+        if presenter_notes:
+            set_notes = f'''
+                    try
+                        set presenter notes of newSlide to {applescript_string(presenter_notes)}
+                    end try
+                    '''
+        
+        return f'''{choose_layout}
+                
+                tell application "Keynote"
+                    activate
+                    {_target_doc(doc_name)}
+                    
+                    {make_slide}
+                    
+                    {apply_layout}
+                    {set_notes}
+                    return (slide number of newSlide as text) & (character id 30) & chosenLayout
+                end tell'''
+    
     async def delete_slide(self, slide_number: int, doc_name: str = "") -> List[TextContent]:
         """Delete slide"""
         try:
             validate_slide_number(slide_number)
             
-            self.runner.run_inline_script(f'''
-                tell application "Keynote"
-                    if "{doc_name}" is "" then
-                        set targetDoc to front document
-                    else
-                        set targetDoc to document "{doc_name}"
-                    end if
-                    
-                    delete slide {slide_number} of targetDoc
-                end tell
-            ''')
+            await self.runner.run_handler_async(
+                script_file='slide.applescript',
+                function_name='deleteSlide',
+                args=[doc_name, slide_number]
+            )
+            self.navigation_ops.adjust_slide_count(doc_name, -1)
+            
+            if not self.verbose:
+                return [TextContent(type="text", text=str(slide_number))]
             
             return [TextContent(
                 type="text",
@@ -165,24 +220,15 @@ class SlideBasicOperations:
         try:
             validate_slide_number(slide_number)
             
-            result = self.runner.run_inline_script(f'''
-                tell application "Keynote"
-                    if "{doc_name}" is "" then
-                        set targetDoc to front document
-                    else
-                        set targetDoc to document "{doc_name}"
-                    end if
-                    
-                    set sourceSlide to slide {slide_number} of targetDoc
-                    set newSlide to duplicate sourceSlide
-                    
-                    if {new_position} is not 0 then
-                        move newSlide to slide {new_position} of targetDoc
-                    end if
-                    
-                    return slide number of newSlide
-                end tell
-            ''')
+            result = await self.runner.run_handler_async(
+                script_file='slide.applescript',
+                function_name='duplicateSlide',
+                args=[doc_name, slide_number, new_position]
+            )
+            self.navigation_ops.adjust_slide_count(doc_name, 1)
+            
+            if not self.verbose:
+                return [TextContent(type="text", text=result)]
             
             return [TextContent(
                 type="text",
@@ -201,18 +247,15 @@ class SlideBasicOperations:
             validate_slide_number(from_position)
             validate_slide_number(to_position)
             
-            self.runner.run_inline_script(f'''
-                tell application "Keynote"
-                    if "{doc_name}" is "" then
-                        set targetDoc to front document
-                    else
-                        set targetDoc to document "{doc_name}"
-                    end if
-                    
-                    set sourceSlide to slide {from_position} of targetDoc
-                    move sourceSlide to slide {to_position} of targetDoc
-                end tell
-            ''')
+            await self.runner.run_handler_async(
+                script_file='slide.applescript',
+                function_name='moveSlide',
+                args=[doc_name, from_position, to_position]
+            )
+            self.navigation_ops.invalidate_slide_info(doc_name)
+            
+            if not self.verbose:
+                return [TextContent(type="text", text=str(to_position))]
             
             return [TextContent(
                 type="text",
@@ -224,3 +267,113 @@ class SlideBasicOperations:
                 type="text",
                 text=f"❌ Failed to move slide: {str(e)}"
             )]
+    
+    async def bulk(self, operations: List[Dict[str, Any]]) -> List[TextContent]:
+        """
+        Run several slide operations in a single script execution
+        
+        Each operation is a dict with an "op" key (add_slide, delete_slide,
+        duplicate_slide or move_slide) plus that operation's arguments.
+        Operations run in order and one failing does not stop the rest.
+        """
+        try:
+            scripts = []
+            smart = False
+            for operation in operations:
+                op = operation.get("op")
+                doc_name = operation.get("doc_name", "")
+                if op == "add_slide":
+                    layout = operation.get("layout", "")
+                    content_type = "" if layout else operation.get("content_type", "")
+                    if not layout and not content_type:
+                        layout = "2"  # Layout 2 is typically Title & Content
+                    smart = smart or bool(content_type)
+                    scripts.append(self._add_slide_script(doc_name, int(operation.get("position", 0)), layout, content_type))
+                elif op == "delete_slide":
+                    validate_slide_number(operation["slide_number"])
+                    scripts.append(self._delete_slide_script(operation["slide_number"], doc_name))
+                elif op == "duplicate_slide":
+                    validate_slide_number(operation["slide_number"])
+                    scripts.append(self._duplicate_slide_script(operation["slide_number"], doc_name, int(operation.get("new_position", 0))))
+                elif op == "move_slide":
+                    validate_slide_number(operation["from_position"])
+                    validate_slide_number(operation["to_position"])
+                    scripts.append(self._move_slide_script(operation["from_position"], operation["to_position"], doc_name))
+                else:
+                    raise ParameterError(f"Unsupported bulk operation: {op}")
+            
+            prelude = self.runner.read_script('smart_layout.applescript') if smart else ""
+            try:
+                results = await self.runner.run_batch_async(scripts, prelude)
+            finally:
+                # Some operations may have run, so cached counts can no longer be trusted
+                for operation in operations:
+                    self.navigation_ops.invalidate_slide_count(operation.get("doc_name", ""))
+            
+            if not self.verbose:
+                return [TextContent(type="text", text=json.dumps(results))]
+            
+            lines = []
+            for operation, result in zip(operations, results):
+                op = operation["op"]
+                if result.startswith("error: "):
+                    lines.append(f"❌ {op}: {result[len('error: '):]}")
+                elif op == "add_slide":
+                    lines.append(f"✅ Added slide {result.partition(chr(0x1e))[0]}")
+                elif op == "delete_slide":
+                    lines.append(f"✅ Deleted slide {operation['slide_number']}")
+                elif op == "duplicate_slide":
+                    lines.append(f"✅ Duplicated slide {operation['slide_number']}, new number: {result}")
+                else:
+                    lines.append(f"✅ Moved slide from position {operation['from_position']} to position {operation['to_position']}")
+            
+            return [TextContent(
+                type="text",
+                text=f"📦 Ran {len(operations)} slide operations:\n" + "\n".join(lines)
+            )]
+            
+        except Exception as e:
+            return [TextContent(
+                type="text",
+                text=f"❌ Failed to run slide operations: {str(e)}"
+            )]
+    
+    @staticmethod
+    def _delete_slide_script(slide_number: int, doc_name: str) -> str:
+        """AppleScript body that deletes a slide"""
+        return f'''
+                tell application "Keynote"
+                    {_target_doc(doc_name)}
+                    
+                    delete slide {slide_number} of targetDoc
+                    return "ok"
+                end tell'''
+    
+    @staticmethod
+    def _duplicate_slide_script(slide_number: int, doc_name: str, new_position: int) -> str:
+        """AppleScript body that duplicates a slide and returns the copy's number"""
+        return f'''
+                tell application "Keynote"
+                    {_target_doc(doc_name)}
+                    
+                    set sourceSlide to slide {slide_number} of targetDoc
+                    set newSlide to duplicate sourceSlide
+                    
+                    if {new_position} is not 0 then
+                        move newSlide to slide {new_position} of targetDoc
+                    end if
+                    
+                    return slide number of newSlide
+                end tell'''
+    
+    @staticmethod
+    def _move_slide_script(from_position: int, to_position: int, doc_name: str) -> str:
+        """AppleScript body that moves a slide"""
+        return f'''
+                tell application "Keynote"
+                    {_target_doc(doc_name)}
+                    
+                    set sourceSlide to slide {from_position} of targetDoc
+                    move sourceSlide to slide {to_position} of targetDoc
+                    return "ok"
+                end tell'''
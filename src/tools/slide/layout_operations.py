@@ -2,54 +2,45 @@
 Slide layout operations
 """
 
-from typing import List
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional, Tuple
 from mcp.types import TextContent
 from ...utils import AppleScriptRunner, validate_slide_number
 
 
+# Seconds a document's layout list is served without revalidation
+_LAYOUTS_TTL = 60.0
+
+
 class SlideLayoutOperations:
     """Slide layout operations"""
     
-    def __init__(self, runner: AppleScriptRunner):
+    # Shared by every instance, so a theme change can drop them in one place
+    _layouts_cache: Dict[str, Tuple[float, List[str]]] = {}
+    # Background refreshes in flight; holding the task keeps it from being collected
+    _layouts_refreshing: Dict[str, "asyncio.Task[None]"] = {}
+    
+    def __init__(self, runner: AppleScriptRunner, verbose: bool = True):
         self.runner = runner
+        # When False, successful results are returned as bare values for programmatic clients
+        self.verbose = verbose
     
     async def set_slide_layout(self, slide_number: int, layout: str, doc_name: str = "") -> List[TextContent]:
         """Set the layout of a slide"""
         try:
             validate_slide_number(slide_number)
             
-            result = self.runner.run_inline_script(f'''
-                tell application "Keynote"
-                    if "{doc_name}" is "" then
-                        set targetDoc to front document
-                    else
-                        set targetDoc to document "{doc_name}"
-                    end if
-                    
-                    try
-                        -- Find the target layout
-                        set targetLayout to missing value
-                        repeat with masterSlide in master slides of targetDoc
-                            if name of masterSlide is "{layout}" then
-                                set targetLayout to masterSlide
-                                exit repeat
-                            end if
-                        end repeat
-                        
-                        if targetLayout is missing value then
-                            return "layout_not_found"
-                        end if
-                        
-                        -- Set slide layout (using correct syntax: base slide)
-                        set base slide of slide {slide_number} of targetDoc to targetLayout
-                        return "success"
-                    on error errMsg
-                        return "error: " & errMsg
-                    end try
-                end tell
-            ''')
+            result = await self.runner.run_handler_async(
+                script_file='slide.applescript',
+                function_name='setSlideLayout',
+                args=[doc_name, slide_number, layout]
+            )
             
-            if result == "success":
+            if result == "success" and not self.verbose:
+                return [TextContent(type="text", text=layout)]
+            elif result == "success":
                 return [TextContent(
                     type="text",
                     text=f"✅ Successfully set layout of slide {slide_number} to: {layout}"
@@ -74,31 +65,13 @@ class SlideLayoutOperations:
     async def get_available_layouts(self, doc_name: str = "") -> List[TextContent]:
         """Get the list of available layouts"""
         try:
-            result = self.runner.run_inline_script(f'''
-                tell application "Keynote"
-                    if "{doc_name}" is "" then
-                        set targetDoc to front document
-                    else
-                        set targetDoc to document "{doc_name}"
-                    end if
-                    
-                    set layoutList to {{}}
-                    repeat with masterSlide in master slides of targetDoc
-                        set end of layoutList to name of masterSlide
-                    end repeat
-                    
-                    -- Use a special delimiter to avoid issues with commas in layout names
-                    set AppleScript's text item delimiters to "|||"
-                    set layoutString to layoutList as string
-                    set AppleScript's text item delimiters to ""
-                    
-                    return layoutString
-                end tell
-            ''')
+            layouts = await self._get_layout_names(doc_name)
             
-            if result:
-                layouts = result.split("|||")
-                layout_list = "\n".join([f"• {layout.strip()}" for layout in layouts if layout.strip()])
+            if not self.verbose:
+                return [TextContent(type="text", text=json.dumps(layouts))]
+            
+            if layouts:
+                layout_list = "\n".join([f"• {layout}" for layout in layouts])
                 return [TextContent(
                     type="text",
                     text=f"📐 Available layouts:\n{layout_list}"
@@ -114,3 +87,68 @@ class SlideLayoutOperations:
                 type="text",
                 text=f"❌ Failed to get layout list: {str(e)}"
             )]
+    
+    async def _get_layout_names(self, doc_name: str) -> List[str]:
+        """
+        Return a document's layout names, served from memory while fresh
+        
+        After the TTL the cached list is still returned while a background
+        refresh runs (stale-while-revalidate).
+        """
+        # The front document can change between calls, so only named
+        # documents are served from the cache
+        cached = self._layouts_cache.get(doc_name) if doc_name else None
+        if cached is None:
+            return await self._load_layout_names(doc_name)
+        
+        if time.monotonic() - cached[0] >= _LAYOUTS_TTL:
+            self._schedule_layouts_refresh(doc_name)
+        return cached[1]
+    
+    def _schedule_layouts_refresh(self, doc_name: str) -> None:
+        """Refresh a document's layout list in the background if not already doing so"""
+        if doc_name in self._layouts_refreshing:
+            return
+        
+        async def refresh() -> None:
+            try:
+                await self._load_layout_names(doc_name)
+            except Exception:
+                # Keep serving the stale list; the next expiry retries
+                pass
+            finally:
+                self._layouts_refreshing.pop(doc_name, None)
+        
+        self._layouts_refreshing[doc_name] = asyncio.get_running_loop().create_task(refresh())
+    
+    async def _load_layout_names(self, doc_name: str) -> List[str]:
+        """Fetch a document's layout names from Keynote and cache them"""
+        if self.runner.bridge is not None:
+            resolved_name, layouts = await self.runner.run_bridge_async('layout_names', doc_name)
+        else:
+            result = await self.runner.run_handler_async(
+                script_file='slide.applescript',
+                function_name='getAvailableLayouts',
+                args=[doc_name]
+            )
+            resolved_name, _, layout_string = result.partition("\x1e")
+            layouts = [layout.strip() for layout in layout_string.split("|||") if layout.strip()]
+        
+        # Cache under the resolved name so the front document is cached too
+        self._layouts_cache[resolved_name or doc_name] = (time.monotonic(), layouts)
+        return layouts
+    
+    def cached_layout_names(self, doc_name: str) -> Optional[List[str]]:
+        """Return a named document's fresh cached layout names without querying Keynote, or None"""
+        cached = self._layouts_cache.get(doc_name) if doc_name else None
+        if cached is None or time.monotonic() - cached[0] >= _LAYOUTS_TTL:
+            return None
+        return cached[1]
+    
+    @classmethod
+    def invalidate_layouts_cache(cls, doc_name: str = "") -> None:
+        """Drop cached layouts for one document, or all documents when no name is given"""
+        if doc_name:
+            cls._layouts_cache.pop(doc_name, None)
+        else:
+            cls._layouts_cache.clear()
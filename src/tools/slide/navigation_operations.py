@@ -2,31 +2,43 @@
 Slide navigation and selection operations
 """
 
-from typing import List
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from mcp.types import TextContent
-from ...utils import AppleScriptRunner, validate_slide_number
+from ...utils import AppleScriptError, AppleScriptRunner, validate_slide_number
+
+
+# Seconds a document's slide count and slide info are served from memory;
+# short because slides can also be edited in Keynote directly
+_SLIDE_COUNT_TTL = 10.0
 
 
 class SlideNavigationOperations:
     """Slide navigation and selection operations"""
     
-    def __init__(self, runner: AppleScriptRunner):
+    # Shared by every instance, so a write made through one SlideTools
+    # (e.g. the guided workflow's) is seen by all of them
+    _slide_count_cache: Dict[str, Tuple[float, int]] = {}
+    _slide_info_cache: Dict[Tuple[str, int], Tuple[float, Tuple[Any, str, Any]]] = {}
+    
+    def __init__(self, runner: AppleScriptRunner, verbose: bool = True):
         self.runner = runner
+        # When False, successful results are returned as bare values for programmatic clients
+        self.verbose = verbose
+        # Handler calls waiting for the next batch
+        self._pending: List[Tuple[str, list, asyncio.Future]] = []
+        # Held so the running drain cannot be garbage-collected mid-batch
+        self._drain_task: Optional[asyncio.Task] = None
     
     async def get_slide_count(self, doc_name: str = "") -> List[TextContent]:
         """Get the number of slides"""
         try:
-            result = self.runner.run_inline_script(f'''
-                tell application "Keynote"
-                    if "{doc_name}" is "" then
-                        set targetDoc to front document
-                    else
-                        set targetDoc to document "{doc_name}"
-                    end if
-                    
-                    return count of slides of targetDoc
-                end tell
-            ''')
+            result = await self._slide_count(doc_name)
+            
+            if not self.verbose:
+                return [TextContent(type="text", text=result)]
             
             return [TextContent(
                 type="text",
@@ -44,17 +56,10 @@ class SlideNavigationOperations:
         try:
             validate_slide_number(slide_number)
             
-            self.runner.run_inline_script(f'''
-                tell application "Keynote"
-                    if "{doc_name}" is "" then
-                        set targetDoc to front document
-                    else
-                        set targetDoc to document "{doc_name}"
-                    end if
-                    
-                    set current slide of targetDoc to slide {slide_number} of targetDoc
-                end tell
-            ''')
+            await self._call('selectSlide', [doc_name, slide_number])
+            
+            if not self.verbose:
+                return [TextContent(type="text", text=str(slide_number))]
             
             return [TextContent(
                 type="text",
@@ -72,50 +77,187 @@ class SlideNavigationOperations:
         try:
             validate_slide_number(slide_number)
             
-            result = self.runner.run_inline_script(f'''
-                tell application "Keynote"
-                    if "{doc_name}" is "" then
-                        set targetDoc to front document
-                    else
-                        set targetDoc to document "{doc_name}"
-                    end if
-                    
-                    set targetSlide to slide {slide_number} of targetDoc
-                    set slideInfo to {{}}
-                    
-                    set end of slideInfo to slide number of targetSlide
-                    
-                    try
-                        set end of slideInfo to name of master slide of targetSlide
-                    on error
-                        set end of slideInfo to "Unknown Layout"
-                    end try
-                    
-                    try
-                        set end of slideInfo to count of text items of targetSlide
-                    on error
-                        set end of slideInfo to 0
-                    end try
-                    
-                    return slideInfo as string
-                end tell
-            ''')
+            number, layout, text_count = await self._slide_info(doc_name, slide_number)
             
-            info_parts = result.replace("{", "").replace("}", "").split(", ")
-            if len(info_parts) >= 3:
-                number, layout, text_count = info_parts[0], info_parts[1], info_parts[2]
+            if not self.verbose:
                 return [TextContent(
                     type="text",
-                    text=f"📊 Slide {slide_number} info:\n• Number: {number}\n• Layout: {layout}\n• Text box count: {text_count}"
+                    text=json.dumps({"number": int(number), "layout": layout, "text_items": int(text_count)})
                 )]
-            else:
+            
+            return [TextContent(
+                type="text",
+                text=f"📊 Slide {slide_number} info:\n• Number: {number}\n• Layout: {layout}\n• Text box count: {text_count}"
+            )]
+            
+        except Exception as e:
+            return [TextContent(
+                type="text",
+                text=f"❌ Failed to get slide info: {str(e)}"
+            )]
+    
+    async def get_all_slide_info(self, doc_name: str = "") -> List[TextContent]:
+        """
+        Get information about every slide
+        
+        The per-slide queries are issued together, so they share batched
+        script executions instead of running one after another.
+        """
+        try:
+            count = int(await self._slide_count(doc_name))
+            infos = await asyncio.gather(*[
+                self._slide_info(doc_name, slide_number) for slide_number in range(1, count + 1)
+            ])
+            
+            if not self.verbose:
                 return [TextContent(
                     type="text",
-                    text=f"📊 Slide {slide_number} info: {result}"
+                    text=json.dumps([
+                        {"number": int(number), "layout": layout, "text_items": int(text_count)}
+                        for number, layout, text_count in infos
+                    ])
                 )]
-                
+            
+            lines = [
+                f"• Slide {number}: {layout} ({text_count} text boxes)"
+                for number, layout, text_count in infos
+            ]
+            return [TextContent(
+                type="text",
+                text=f"📊 {count} slides:\n" + "\n".join(lines)
+            )]
+            
         except Exception as e:
             return [TextContent(
                 type="text",
                 text=f"❌ Failed to get slide info: {str(e)}"
             )]
+    
+    async def _slide_count(self, doc_name: str) -> str:
+        """Return a document's slide count, from memory while fresh"""
+        cached = self.cached_slide_count(doc_name)
+        if cached is not None:
+            return str(cached)
+        
+        if self.runner.bridge is not None:
+            result = str(await self.runner.run_bridge_async('slide_count', doc_name))
+        else:
+            result = await self._call('getSlideCount', [doc_name])
+        
+        # The front document can change between calls, so only named
+        # documents are cached
+        if doc_name and result.isdigit():
+            self._slide_count_cache[doc_name] = (time.monotonic(), int(result))
+        return result
+    
+    async def _slide_info(self, doc_name: str, slide_number: int) -> Tuple[Any, str, Any]:
+        """Return a slide's number, layout name and text item count, from memory while fresh"""
+        cached = self._slide_info_cache.get((doc_name, slide_number)) if doc_name else None
+        if cached is not None and time.monotonic() - cached[0] < _SLIDE_COUNT_TTL:
+            return cached[1]
+        
+        if self.runner.bridge is not None:
+            number, layout, text_count = await self.runner.run_bridge_async('slide_info', doc_name, slide_number)
+        else:
+            result = await self._call('getSlideInfo', [doc_name, slide_number])
+            number, layout, text_count = result.split("\x1f", 2)
+        
+        if doc_name:
+            self._slide_info_cache[(doc_name, slide_number)] = (time.monotonic(), (number, layout, text_count))
+        return number, layout, text_count
+    
+    async def _call(self, function_name: str, args: list) -> str:
+        """
+        Call a slide.applescript handler, batching it with concurrent calls
+        
+        A call made while no batch is running goes out on its own. Calls made
+        while one is running are queued and sent together in one script
+        execution once it finishes.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((function_name, args, future))
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain())
+        return await future
+    
+    async def _drain(self) -> None:
+        """Run queued handler calls until the queue is empty"""
+        while self._pending:
+            batch, self._pending = self._pending, []
+            try:
+                if len(batch) == 1:
+                    function_name, args, _ = batch[0]
+                    results = [await self.runner.run_handler_async(
+                        script_file='slide.applescript',
+                        function_name=function_name,
+                        args=args
+                    )]
+                else:
+                    # One fixed handler serves every batch, so the compiled
+                    # script is reused and no values reach the source
+                    requests = [
+                        "|||".join([function_name, args[0], str(args[1]) if len(args) > 1 else ""])
+                        for function_name, args, _ in batch
+                    ]
+                    output = await self.runner.run_handler_async(
+                        script_file='slide.applescript',
+                        function_name='runQueries',
+                        args=["\x1e".join(requests)]
+                    )
+                    results = output[len("batch:"):].split("\x1e")
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, _, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if len(batch) > 1 and result.startswith("error: "):
+                    future.set_exception(AppleScriptError(f"AppleScript execution failed: {result[len('error: '):]}"))
+                else:
+                    future.set_result(result)
+            for _, _, future in batch[len(results):]:
+                if not future.done():
+                    future.set_exception(AppleScriptError("AppleScript batch returned no result"))
+    
+    def cached_slide_count(self, doc_name: str) -> Optional[int]:
+        """Return a named document's recently fetched slide count, or None"""
+        cached = self._slide_count_cache.get(doc_name) if doc_name else None
+        if cached is None or time.monotonic() - cached[0] >= _SLIDE_COUNT_TTL:
+            return None
+        return cached[1]
+    
+    def adjust_slide_count(self, doc_name: str, delta: int) -> None:
+        """
+        Apply a known change to a cached slide count without re-querying Keynote
+        
+        Slides renumber when one is added or removed, so the document's
+        cached slide info is dropped. A change to the front document may
+        be to any named document, so it drops every cached count.
+        """
+        if not doc_name:
+            self.invalidate_slide_count()
+            return
+        
+        cached = self._slide_count_cache.get(doc_name) if doc_name else None
+        if cached is not None:
+            self._slide_count_cache[doc_name] = (cached[0], cached[1] + delta)
+        self.invalidate_slide_info(doc_name)
+    
+    def invalidate_slide_count(self, doc_name: str = "") -> None:
+        """Drop cached slide count and info for one document, or all documents when no name is given"""
+        if doc_name:
+            self._slide_count_cache.pop(doc_name, None)
+        else:
+            self._slide_count_cache.clear()
+        self.invalidate_slide_info(doc_name)
+    
+    def invalidate_slide_info(self, doc_name: str = "") -> None:
+        """Drop cached slide info for one document, or all documents when no name is given"""
+        if doc_name:
+            for key in [key for key in self._slide_info_cache if key[0] == doc_name]:
+                del self._slide_info_cache[key]
+        else:
+            self._slide_info_cache.clear()
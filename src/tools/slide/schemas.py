@@ -2,21 +2,34 @@
 Tool definitions for slide operations
 """
 
+import functools
+from typing import Tuple
 from mcp.types import Tool
 
-def get_slide_tool_schemas():
-    """Get all slide operation tool schemas"""
-    return [
+
+# Property definitions shared by most slide tools
+_DOC_NAME_PROP = {
+    "type": "string",
+    "description": "Document name (optional, defaults to current document)"
+}
+
+_SLIDE_NUMBER_PROP = {
+    "type": "integer",
+    "description": "Slide number"
+}
+
+
+@functools.lru_cache(maxsize=1)
+def get_slide_tool_schemas() -> Tuple[Tool, ...]:
+    """Get all slide operation tool schemas (built once; a tuple so the cached value can't be mutated)"""
+    return (
         Tool(
             name="add_slide",
             description="Add new slide with optional smart layout selection based on content type",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "doc_name": {
-                        "type": "string",
-                        "description": "Document name (optional, defaults to current document)"
-                    },
+                    "doc_name": _DOC_NAME_PROP,
                     "position": {
                         "type": "integer",
                         "description": "Insert position (optional, 0 means add at the end)"
@@ -42,10 +55,7 @@ def get_slide_tool_schemas():
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "doc_name": {
-                        "type": "string",
-                        "description": "Document name (optional, defaults to current document)"
-                    },
+                    "doc_name": _DOC_NAME_PROP,
                     "slide_number": {
                         "type": "integer",
                         "description": "Slide number to delete"
@@ -60,10 +70,7 @@ def get_slide_tool_schemas():
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "doc_name": {
-                        "type": "string",
-                        "description": "Document name (optional, defaults to current document)"
-                    },
+                    "doc_name": _DOC_NAME_PROP,
                     "slide_number": {
                         "type": "integer",
                         "description": "Slide number to duplicate"
@@ -82,10 +89,7 @@ def get_slide_tool_schemas():
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "doc_name": {
-                        "type": "string",
-                        "description": "Document name (optional, defaults to current document)"
-                    },
+                    "doc_name": _DOC_NAME_PROP,
                     "from_position": {
                         "type": "integer",
                         "description": "Original position"
@@ -104,10 +108,7 @@ def get_slide_tool_schemas():
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "doc_name": {
-                        "type": "string",
-                        "description": "Document name (optional, defaults to current document)"
-                    }
+                    "doc_name": _DOC_NAME_PROP
                 }
             }
         ),
@@ -117,14 +118,8 @@ def get_slide_tool_schemas():
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "doc_name": {
-                        "type": "string",
-                        "description": "Document name (optional, defaults to current document)"
-                    },
-                    "slide_number": {
-                        "type": "integer",
-                        "description": "Slide number"
-                    }
+                    "doc_name": _DOC_NAME_PROP,
+                    "slide_number": _SLIDE_NUMBER_PROP
                 },
                 "required": ["slide_number"]
             }
@@ -135,14 +130,8 @@ def get_slide_tool_schemas():
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "doc_name": {
-                        "type": "string",
-                        "description": "Document name (optional, defaults to current document)"
-                    },
-                    "slide_number": {
-                        "type": "integer",
-                        "description": "Slide number"
-                    },
+                    "doc_name": _DOC_NAME_PROP,
+                    "slide_number": _SLIDE_NUMBER_PROP,
                     "layout": {
                         "type": "string",
                         "description": "Layout type"
@@ -157,29 +146,72 @@ def get_slide_tool_schemas():
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "doc_name": {
-                        "type": "string",
-                        "description": "Document name (optional, defaults to current document)"
-                    },
-                    "slide_number": {
-                        "type": "integer",
-                        "description": "Slide number"
-                    }
+                    "doc_name": _DOC_NAME_PROP,
+                    "slide_number": _SLIDE_NUMBER_PROP
                 },
                 "required": ["slide_number"]
             }
         ),
+        Tool(
+            name="get_all_slide_info",
+            description="Get the number, layout and text box count of every slide in one call",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "doc_name": _DOC_NAME_PROP
+                }
+            }
+        ),
+        Tool(
+            name="bulk_slide_operations",
+            description="Delete, duplicate or move several slides in a single AppleScript call",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "operations": {
+                        "type": "array",
+                        "description": "Operations to run in order; each has an 'op' plus that tool's arguments",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "op": {
+                                    "type": "string",
+                                    "enum": ["delete_slide", "duplicate_slide", "move_slide"],
+                                    "description": "Operation to run"
+                                },
+                                "doc_name": _DOC_NAME_PROP,
+                                "slide_number": {
+                                    "type": "integer",
+                                    "description": "Slide number (delete_slide, duplicate_slide)"
+                                },
+                                "new_position": {
+                                    "type": "integer",
+                                    "description": "Position for the copy (duplicate_slide, optional)"
+                                },
+                                "from_position": {
+                                    "type": "integer",
+                                    "description": "Source position (move_slide)"
+                                },
+                                "to_position": {
+                                    "type": "integer",
+                                    "description": "Target position (move_slide)"
+                                }
+                            },
+                            "required": ["op"]
+                        }
+                    }
+                },
+                "required": ["operations"]
+            }
+        ),
         Tool(
             name="get_available_layouts",
             description="Get available layout list",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "doc_name": {
-                        "type": "string",
-                        "description": "Document name (optional, defaults to current document)"
-                    }
+                    "doc_name": _DOC_NAME_PROP
                 }
             }
         )
-    ]
+    )
@@ -2,244 +2,309 @@
 Smart Layout Tools - Content-aware slide layout selection
 """
 
-from typing import Any, Dict, List, Optional
+import functools
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from mcp.types import Tool, TextContent
 from ..utils import AppleScriptRunner, validate_slide_number
 
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; the stdlib parser gives the same result
+    import json as _json
+
+
+# Seconds a document's master slide list is served from memory
+_MASTER_SLIDES_TTL = 30.0
+
+# Property definitions shared by the smart layout tools
+_DOC_NAME_PROP = {
+    "type": "string",
+    "description": "Document name (optional, uses front document if empty)"
+}
+
+_CONTENT_TYPE_PROP = {
+    "type": "string",
+    "description": "Type of content: 'image', 'photo', 'text', 'content', 'title', 'quote', 'comparison', 'split', 'gallery', 'multiple_images', 'blank'"
+}
+
+_CONTENT_DESCRIPTION_PROP = {
+    "type": "string",
+    "description": "Brief description of the content to be added"
+}
+
+# Static responses, built once; the model is shared but each call gets its own list
+_NO_MASTER_SLIDES = TextContent(type="text", text="❌ No master slides found")
+_NO_LAYOUT_SUGGESTION = TextContent(type="text", text="❌ Could not determine appropriate layout")
+_NO_RECOMMENDATIONS = TextContent(type="text", text="❌ No layout recommendations available")
+
+# Layout name keywords preferred for each content type, lowercased for
+# case-insensitive matching like AppleScript's "contains"
+_CONTENT_LAYOUT_KEYWORDS = {
+    "image": ("photo",), "photo": ("photo",),
+    "text": ("bullets", "content"), "content": ("bullets", "content"),
+    "quote": ("quote",),
+    "comparison": ("two", "split", "comparison"), "split": ("two", "split", "comparison"),
+    "gallery": ("3 up", "gallery", "grid"), "multiple_images": ("3 up", "gallery", "grid"),
+    "blank": ("blank",),
+}
+
+
+def suggest_layout(layout_names: List[str], content_type: str) -> str:
+    """
+    Pick the layout best suited to a content type from a list of layout names
+    
+    Same rules as suggestLayoutForContent in smart_layout.applescript, so
+    a known layout list needs no round-trip to Keynote. Matching ignores
+    case, as AppleScript's string comparisons do.
+    """
+    lowered = [(name, name.lower()) for name in layout_names]
+    
+    def first(matches) -> str:
+        return next((name for name, lower in lowered if matches(lower)), "")
+    
+    content_type = content_type.lower()
+    if content_type == "title":
+        suggested = first(lambda name: "title" in name and "bullets" not in name)
+    else:
+        keywords = _CONTENT_LAYOUT_KEYWORDS.get(content_type, ())
+        suggested = first(lambda name: any(keyword in name for keyword in keywords))
+        if not suggested and content_type in ("image", "photo"):
+            suggested = first(lambda name: "image" in name or "picture" in name)
+    
+    if not suggested:
+        suggested = first(lambda name: "title" in name and "bullets" in name)
+    if not suggested and layout_names:
+        suggested = layout_names[1] if len(layout_names) > 1 else layout_names[0]
+    return suggested
+
+
+def recommend_layouts(layout_names: List[str], content_type: str, count: int = 3) -> List[str]:
+    """
+    Return the suggested layout followed by other layouts, up to count names
+    
+    The first name is always suggest_layout's pick, so one ranking serves
+    both the single suggestion and the recommendation list.
+    """
+    primary = suggest_layout(layout_names, content_type)
+    others = [name for name in layout_names if name != primary]
+    return ([primary] if primary else []) + others[:count - 1]
+
+
+def _tool_result(error_prefix: str):
+    """Turn an exception raised by a tool method into an error TextContent"""
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(*args, **kwargs) -> List[TextContent]:
+            try:
+                return await method(*args, **kwargs)
+            except Exception as e:
+                return [TextContent(
+                    type="text",
+                    text=f"❌ {error_prefix}: {str(e)}"
+                )]
+        return wrapper
+    return decorator
+
+
+@functools.lru_cache(maxsize=1)
+def _smart_layout_tool_schemas() -> Tuple[Tool, ...]:
+    """Smart layout tool schemas (built once; a tuple so the cached value can't be mutated)"""
+    return (
+        Tool(
+            name="get_available_master_slides",
+            description="Get list of available master slide layouts in the presentation",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "doc_name": _DOC_NAME_PROP
+                },
+                "required": []
+            }
+        ),
+        Tool(
+            name="suggest_layout_for_content",
+            description="Get recommended slide layout based on content type",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "content_type": _CONTENT_TYPE_PROP,
+                    "content_description": _CONTENT_DESCRIPTION_PROP,
+                    "doc_name": _DOC_NAME_PROP
+                },
+                "required": ["content_type"]
+            }
+        ),
+        Tool(
+            name="add_slide_with_smart_layout",
+            description="Add a new slide with automatically selected layout based on content type",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "content_type": _CONTENT_TYPE_PROP,
+                    "content_description": _CONTENT_DESCRIPTION_PROP,
+                    "position": {
+                        "type": "integer",
+                        "description": "Position to insert slide (0 for end)"
+                    },
+                    "doc_name": _DOC_NAME_PROP
+                },
+                "required": ["content_type"]
+            }
+        ),
+        Tool(
+            name="get_layout_recommendations",
+            description="Get top 3 layout recommendations for specific content",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "content_type": _CONTENT_TYPE_PROP,
+                    "content_description": _CONTENT_DESCRIPTION_PROP,
+                    "doc_name": _DOC_NAME_PROP
+                },
+                "required": ["content_type"]
+            }
+        )
+    )
+
 
 class SmartLayoutTools:
     """Smart layout selection tools for content-aware slide creation"""
     
-    def __init__(self):
-        self.runner = AppleScriptRunner()
+    # Shared by every instance, so a theme change can drop it in one place
+    _master_cache: Dict[str, Tuple[float, List[str]]] = {}
+    
+    def __init__(self, runner: Optional[AppleScriptRunner] = None):
+        self.runner = runner or AppleScriptRunner.instance()
         self.script_file = 'smart_layout.applescript'
+        self.runner.precompile(self.script_file)
     
     def get_tools(self) -> List[Tool]:
         """Get all smart layout tools"""
-        return [
-            Tool(
-                name="get_available_master_slides",
-                description="Get list of available master slide layouts in the presentation",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "doc_name": {
-                            "type": "string",
-                            "description": "Document name (optional, uses front document if empty)"
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="suggest_layout_for_content",
-                description="Get recommended slide layout based on content type",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "content_type": {
-                            "type": "string",
-                            "description": "Type of content: 'image', 'photo', 'text', 'content', 'title', 'quote', 'comparison', 'split', 'gallery', 'multiple_images', 'blank'"
-                        },
-                        "content_description": {
-                            "type": "string",
-                            "description": "Brief description of the content to be added"
-                        },
-                        "doc_name": {
-                            "type": "string",
-                            "description": "Document name (optional, uses front document if empty)"
-                        }
-                    },
-                    "required": ["content_type"]
-                }
-            ),
-            Tool(
-                name="add_slide_with_smart_layout",
-                description="Add a new slide with automatically selected layout based on content type",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "content_type": {
-                            "type": "string",
-                            "description": "Type of content: 'image', 'photo', 'text', 'content', 'title', 'quote', 'comparison', 'split', 'gallery', 'multiple_images', 'blank'"
-                        },
-                        "content_description": {
-                            "type": "string",
-                            "description": "Brief description of the content to be added"
-                        },
-                        "position": {
-                            "type": "integer",
-                            "description": "Position to insert slide (0 for end)"
-                        },
-                        "doc_name": {
-                            "type": "string",
-                            "description": "Document name (optional, uses front document if empty)"
-                        }
-                    },
-                    "required": ["content_type"]
-                }
-            ),
-            Tool(
-                name="get_layout_recommendations",
-                description="Get top 3 layout recommendations for specific content",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "content_type": {
-                            "type": "string",
-                            "description": "Type of content: 'image', 'photo', 'text', 'content', 'title', 'quote', 'comparison', 'split', 'gallery', 'multiple_images', 'blank'"
-                        },
-                        "content_description": {
-                            "type": "string",
-                            "description": "Brief description of the content to be added"
-                        },
-                        "doc_name": {
-                            "type": "string",
-                            "description": "Document name (optional, uses front document if empty)"
-                        }
-                    },
-                    "required": ["content_type"]
-                }
-            )
-        ]
+        return list(_smart_layout_tool_schemas())
     
+    @_tool_result("Failed to get master slides")
     async def get_available_master_slides(self, doc_name: str = "") -> List[TextContent]:
         """Get available master slide layouts"""
-        try:
-            result = self.runner.run_function(
-                script_file=self.script_file,
-                function_name='getAvailableMasterSlides',
-                args=[doc_name]
-            )
+        layouts = await self._get_master_slides(doc_name)
+        
+        if layouts:
+            layout_list = "\n".join(f"• {layout}" for layout in layouts)
             
-            # Parse the JSON-like result
-            if result and result.strip():
-                # Remove brackets and quotes, split by comma
-                clean_result = result.strip('[]"')
-                layouts = [layout.strip('"') for layout in clean_result.split('", "')]
-                
-                layout_list = "\n".join([f"• {layout}" for layout in layouts])
-                
-                return [TextContent(
-                    type="text",
-                    text=f"📋 Available master slide layouts:\n{layout_list}"
-                )]
-            else:
-                return [TextContent(
-                    type="text",
-                    text="❌ No master slides found"
-                )]
-                
-        except Exception as e:
             return [TextContent(
                 type="text",
-                text=f"❌ Failed to get master slides: {str(e)}"
+                text=f"📋 Available master slide layouts:\n{layout_list}"
             )]
+        else:
+            return [_NO_MASTER_SLIDES]
+    
+    async def _get_master_slides(self, doc_name: str) -> List[str]:
+        """Return a document's master slide names, served from memory while fresh"""
+        # The front document can change between calls, so only named
+        # documents are served from the cache
+        cached = self.cached_master_slides(doc_name)
+        if cached is not None:
+            return cached
+        
+        result = await self.runner.run_handler_async(
+            script_file=self.script_file,
+            function_name='getAvailableMasterSlides',
+            args=[doc_name]
+        )
+        
+        resolved_name, _, layout_json = result.partition("\x1e")
+        layouts = _json.loads(layout_json) if layout_json else []
+        
+        # Cache under the resolved name so the front document is cached too
+        if resolved_name or doc_name:
+            self._master_cache[resolved_name or doc_name] = (time.monotonic(), layouts)
+        return layouts
+    
+    def cached_master_slides(self, doc_name: str) -> Optional[List[str]]:
+        """Return a named document's fresh cached master slide names without querying Keynote, or None"""
+        cached = self._master_cache.get(doc_name) if doc_name else None
+        if cached is None or time.monotonic() - cached[0] >= _MASTER_SLIDES_TTL:
+            return None
+        return cached[1]
     
+    @classmethod
+    def invalidate_master_cache(cls, doc_name: str = "") -> None:
+        """Drop cached master slides for one document, or all documents when no name is given"""
+        if doc_name:
+            cls._master_cache.pop(doc_name, None)
+        else:
+            cls._master_cache.clear()
+    
+    @_tool_result("Failed to suggest layout")
     async def suggest_layout_for_content(self, content_type: str, content_description: str = "", doc_name: str = "") -> List[TextContent]:
         """Suggest best layout for content type"""
-        try:
-            result = self.runner.run_function(
-                script_file=self.script_file,
-                function_name='suggestLayoutForContent',
-                args=[doc_name, content_type, content_description]
-            )
-            
-            if result and result.strip():
-                return [TextContent(
-                    type="text",
-                    text=f"💡 Recommended layout for '{content_type}' content: {result.strip()}"
-                )]
-            else:
-                return [TextContent(
-                    type="text",
-                    text="❌ Could not determine appropriate layout"
-                )]
-                
-        except Exception as e:
+        result = suggest_layout(await self._get_master_slides(doc_name), content_type)
+        
+        if result:
             return [TextContent(
                 type="text",
-                text=f"❌ Failed to suggest layout: {str(e)}"
+                text=f"💡 Recommended layout for '{content_type}' content: {result}"
             )]
+        else:
+            return [_NO_LAYOUT_SUGGESTION]
     
+    @_tool_result("Failed to add slide with smart layout")
     async def add_slide_with_smart_layout(self, content_type: str, content_description: str = "", position: int = 0, doc_name: str = "") -> List[TextContent]:
         """Add slide with automatically selected layout"""
-        try:
-            result = self.runner.run_function(
-                script_file=self.script_file,
-                function_name='addSlideWithSmartLayout',
-                args=[doc_name, position, content_type, content_description]
-            )
+        # A fresh cached master list lets the layout be chosen here; otherwise
+        # the handler chooses it, so the slide still takes one script execution
+        layout_name = ""
+        cached_layouts = self.cached_master_slides(doc_name)
+        if cached_layouts is not None:
+            layout_name = suggest_layout(cached_layouts, content_type) or "default"
+        
+        # Image-type slides carry the description as a presenter-notes suggestion
+        presenter_notes = ""
+        if content_type in ["image", "photo", "gallery", "multiple_images"] and content_description:
+            presenter_notes = f"Image suggestion: {content_description}"
+        
+        result = await self.runner.run_handler_async(
+            script_file=self.script_file,
+            function_name='addSlideWithSmartLayout',
+            args=[doc_name, position, layout_name, content_type, presenter_notes]
+        )
+        
+        slide_number, separator, layout = result.partition("|")
+        if separator:
+            # Check if presenter notes were added
+            notes_info = ""
+            if presenter_notes:
+                notes_info = " + presenter notes with image suggestion"
             
-            if result and "|" in result:
-                slide_number, layout = result.split("|", 1)
-                
-                # Check if presenter notes were added
-                notes_info = ""
-                if content_type in ["image", "photo", "gallery", "multiple_images"] and content_description:
-                    notes_info = " + presenter notes with image suggestion"
-                
-                if layout == "default":
-                    return [TextContent(
-                        type="text",
-                        text=f"✅ Added slide {slide_number} with default layout (suggested layout not available){notes_info}"
-                    )]
-                else:
-                    return [TextContent(
-                        type="text",
-                        text=f"✅ Added slide {slide_number} with smart layout: '{layout}' (optimized for {content_type} content){notes_info}"
-                    )]
+            if layout == "default":
+                return [TextContent(
+                    type="text",
+                    text=f"✅ Added slide {slide_number} with default layout (suggested layout not available){notes_info}"
+                )]
             else:
                 return [TextContent(
                     type="text",
-                    text=f"✅ Added slide with smart layout for {content_type} content"
+                    text=f"✅ Added slide {slide_number} with smart layout: '{layout}' (optimized for {content_type} content){notes_info}"
                 )]
-                
-        except Exception as e:
+        else:
             return [TextContent(
                 type="text",
-                text=f"❌ Failed to add slide with smart layout: {str(e)}"
+                text=f"✅ Added slide with smart layout for {content_type} content"
             )]
     
+    @_tool_result("Failed to get layout recommendations")
     async def get_layout_recommendations(self, content_type: str, content_description: str = "", doc_name: str = "") -> List[TextContent]:
         """Get top 3 layout recommendations"""
-        try:
-            result = self.runner.run_function(
-                script_file=self.script_file,
-                function_name='getLayoutRecommendations',
-                args=[doc_name, content_type, content_description]
-            )
+        recommendations = recommend_layouts(await self._get_master_slides(doc_name), content_type)
+        
+        if recommendations:
+            lines = [f"🎯 Top layout recommendations for '{content_type}' content:"]
+            for rank, layout in enumerate(recommendations, 1):
+                lines.append(f"{rank}. {layout}{' (Best match)' if rank == 1 else ''}")
             
-            if result and result.strip():
-                recommendations = result.split("|")
-                
-                if len(recommendations) >= 1 and recommendations[0]:
-                    rec_text = f"🎯 Top layout recommendations for '{content_type}' content:\n"
-                    rec_text += f"1. {recommendations[0]} (Best match)\n"
-                    
-                    if len(recommendations) >= 2 and recommendations[1]:
-                        rec_text += f"2. {recommendations[1]}\n"
-                    
-                    if len(recommendations) >= 3 and recommendations[2]:
-                        rec_text += f"3. {recommendations[2]}\n"
-                    
-                    return [TextContent(
-                        type="text",
-                        text=rec_text.strip()
-                    )]
-                else:
-                    return [TextContent(
-                        type="text",
-                        text="❌ No layout recommendations available"
-                    )]
-            else:
-                return [TextContent(
-                    type="text",
-                    text="❌ Could not get layout recommendations"
-                )]
-                    
-        except Exception as e:
             return [TextContent(
                 type="text",
-                text=f"❌ Failed to get layout recommendations: {str(e)}"
-            )]
\ No newline at end of file
+                text="\n".join(lines)
+            )]
+        else:
+            return [_NO_RECOMMENDATIONS]
\ No newline at end of file
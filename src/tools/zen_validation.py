@@ -2,195 +2,297 @@
 Zen Validation Tools - Implements Garr Reynolds' Presentation Zen principles
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import functools
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from mcp.types import Tool, TextContent
-from ..utils import AppleScriptRunner
+from ..utils import AppleScriptRunner, ParameterError
 import re
-from collections import Counter
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; the stdlib parser gives the same result
+    import json as _json
+
+
+# Seconds a document's slide text is reused across zen tool calls
+_SLIDE_CONTENT_TTL = 2.0
+
+# Runs of whitespace, collapsed to one space before counting words
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# A stretch between periods with some non-space text, i.e. one sentence
+_SENTENCE_RE = re.compile(r'[^.]*[^.\s][^.]*')
+
+# doc_name property shared by the zen tools that take an optional document
+_DOC_NAME_PROP = {
+    "type": "string",
+    "description": "Presentation document name (optional)"
+}
+
+# The word "bullet" in any case, matched without lowercasing a copy of the text
+_BULLET_WORD_RE = re.compile('bullet', re.IGNORECASE)
+
+# Analysed in place of the document when its slide text can't be read
+_SAMPLE_SLIDE_CONTENT = {
+    1: "Welcome to our quarterly review meeting presentation",
+    2: "Our key objectives for this quarter include increasing sales by 15%, improving customer satisfaction scores, and launching two new product lines",
+    3: "Sales Performance Dashboard showing multiple metrics and charts",
+    4: "Customer Feedback Analysis with detailed bullet points and statistics",
+    5: "Next Steps and Action Items for the upcoming quarter"
+}
+
+# Minimum font size and viewing distance for each room size
+_ROOM_SPECS = {
+    "small": {"min_font": 24, "distance": "15 feet"},
+    "medium": {"min_font": 32, "distance": "25 feet"},
+    "large": {"min_font": 44, "distance": "40 feet"},
+    "auditorium": {"min_font": 60, "distance": "60+ feet"}
+}
+
+# Story guidance for each emotional goal
+_EMOTIONAL_GOAL_GUIDANCE = {
+    "inspire": "🌟 **Inspiration Focus**: Use aspirational imagery, success stories, and future vision",
+    "convince": "💪 **Persuasion Focus**: Build logical progression, address objections, use social proof",
+    "educate": "🎓 **Education Focus**: Break complex ideas into simple concepts, use analogies",
+    "entertain": "🎭 **Entertainment Focus**: Use humor, surprising facts, engaging narratives",
+    "motivate": "🚀 **Motivation Focus**: Create urgency, show benefits, inspire action"
+}
+
+# Closing tips of suggest_story_structure
+_STORY_WISDOM = (
+    "🧘 **Zen Storytelling Wisdom:**\n"
+    "• What you leave out is as important as what you include\n"
+    "• Silence is your most powerful tool\n"
+    "• The audience should feel, not just think\n"
+    "• Every slide should advance the narrative\n"
+    "• Trust the audience to connect the dots\n\n"
+)
+
+# Suggestions every slide gets at a kanso optimization level
+_KANSO_LEVEL_SUGGESTIONS = {
+    "aggressive": ("Consider eliminating this slide entirely",),
+}
+
+# Closing tips of apply_kanso_principles
+_KANSO_WISDOM = (
+    "🌸 **Kanso Wisdom:**\n"
+    "• Eliminate everything that doesn't serve the message\n"
+    "• Empty space is not wasted space\n"
+    "• Restraint creates elegance\n"
+    "• Less is more powerful\n"
+)
+
+# Contrast section of check_back_row_visibility
+_CONTRAST_GUIDELINES = (
+    "🎨 **Color Contrast Guidelines:**\n"
+    "• Dark text on light background: minimum 4.5:1 ratio\n"
+    "• Light text on dark background: minimum 3:1 ratio\n"
+    "• Avoid red/green combinations (colorblind accessibility)\n\n"
+)
+
+# Closing tips of check_back_row_visibility
+_VISIBILITY_WISDOM = (
+    "🧘 **Zen Visibility Wisdom:**\n"
+    "• Design for the person in the worst seat\n"
+    "• If they can't see it, it doesn't exist\n"
+    "• Clarity is compassion for your audience\n"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _zen_tool_schemas() -> Tuple[Tool, ...]:
+    """Zen validation tool schemas (built once; a tuple so the cached value can't be mutated)"""
+    return (
+        Tool(
+            name="validate_zen_principles",
+            description="🧘 ZEN VALIDATOR: Comprehensive analysis of your presentation against Garr Reynolds' Presentation Zen principles. Validates the 6-word rule, detects text-heavy slides, checks visual balance, and provides kanso-based simplification suggestions.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "doc_name": {
+                        "type": "string",
+                        "description": "Name of the presentation document to validate (optional - defaults to active presentation)"
+                    },
+                    "check_type": {
+                        "type": "string",
+                        "description": "Type of zen validation to perform",
+                        "enum": ["full", "text_simplicity", "text_density", "visual_balance", "kanso_simplicity"],
+                        "default": "full"
+                    },
+                    "slide_range": {
+                        "type": "string",
+                        "description": "Range of slides to check (e.g., '1-5', 'all') - defaults to all slides",
+                        "default": "all"
+                    }
+                },
+                "required": [],
+                "additionalProperties": False
+            }
+        ),
+        Tool(
+            name="detect_text_overload",
+            description="📝 TEXT ANALYZER: Identifies slides with excessive text and suggests conversion to visual formats following zen principles. Detects bullet-point heavy slides and recommends image-based alternatives.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "doc_name": _DOC_NAME_PROP,
+                    "word_threshold": {
+                        "type": "integer",
+                        "description": "Maximum words per slide (zen recommendation is 15-20 for Spanish)",
+                        "default": 15,
+                        "minimum": 5,
+                        "maximum": 50
+                    },
+                    "provide_alternatives": {
+                        "type": "boolean",
+                        "description": "Include visual alternative suggestions for text-heavy slides",
+                        "default": True
+                    }
+                },
+                "required": [],
+                "additionalProperties": False
+            }
+        ),
+        Tool(
+            name="suggest_story_structure",
+            description="📖 STORY ARCHITECT: Analyzes your presentation content and suggests narrative structure following zen storytelling principles. Identifies key moments for emotional impact and recommends flow improvements.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "presentation_topic": {
+                        "type": "string",
+                        "description": "Main topic or message of your presentation"
+                    },
+                    "target_audience": {
+                        "type": "string",
+                        "description": "Primary audience for the presentation",
+                        "enum": ["executives", "technical", "general", "educational", "creative"],
+                        "default": "general"
+                    },
+                    "presentation_length": {
+                        "type": "integer",
+                        "description": "Number of slides in presentation",
+                        "minimum": 1,
+                        "maximum": 50
+                    },
+                    "emotional_goal": {
+                        "type": "string",
+                        "description": "Primary emotional response you want to evoke",
+                        "enum": ["inspire", "convince", "educate", "entertain", "motivate"],
+                        "default": "convince"
+                    }
+                },
+                "required": ["presentation_topic", "presentation_length"],
+                "additionalProperties": False
+            }
+        ),
+        Tool(
+            name="apply_kanso_principles",
+            description="✨ KANSO OPTIMIZER: Applies zen principles of simplicity and elimination to your slides. Identifies unnecessary elements and suggests refinements for maximum visual impact through subtraction.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "doc_name": _DOC_NAME_PROP,
+                    "optimization_level": {
+                        "type": "string",
+                        "description": "Level of kanso optimization to apply",
+                        "enum": ["gentle", "moderate", "aggressive"],
+                        "default": "moderate"
+                    },
+                    "preserve_branding": {
+                        "type": "boolean",
+                        "description": "Keep essential branding elements while simplifying",
+                        "default": True
+                    }
+                },
+                "required": [],
+                "additionalProperties": False
+            }
+        ),
+        Tool(
+            name="check_back_row_visibility",
+            description="👀 VISIBILITY VALIDATOR: Ensures your presentation is readable from the back row following zen design principles. Checks font sizes, contrast ratios, and visual hierarchy for optimal audience experience.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "doc_name": _DOC_NAME_PROP,
+                    "room_size": {
+                        "type": "string",
+                        "description": "Approximate room size for visibility calculations",
+                        "enum": ["small", "medium", "large", "auditorium"],
+                        "default": "medium"
+                    },
+                    "check_contrast": {
+                        "type": "boolean",
+                        "description": "Validate color contrast ratios",
+                        "default": True
+                    }
+                },
+                "required": [],
+                "additionalProperties": False
+            }
+        )
+    )
+
+
+class _SlideStats(NamedTuple):
+    """Text measures of one slide, computed once and shared by every check"""
+    word_count: int
+    sentence_count: int
+    bullet_count: int
+    mentions_bullet: bool
 
 
 class ZenValidationTools:
     """Tools that validate presentations against Presentation Zen principles"""
     
-    def __init__(self):
-        self.runner = AppleScriptRunner()
+    def __init__(self, runner: Optional[AppleScriptRunner] = None):
+        self.runner = runner or AppleScriptRunner.instance()
+        self.runner.precompile('zen_analysis.applescript')
+        self._content_cache: Dict[Tuple[str, int, int], Tuple[float, Dict[int, str]]] = {}
+        # One fetch per document at a time; later callers read its result from the cache
+        self._content_locks: Dict[str, asyncio.Lock] = {}
     
     def get_tools(self) -> List[Tool]:
         """Get zen validation tools"""
-        return [
-            Tool(
-                name="validate_zen_principles",
-                description="🧘 ZEN VALIDATOR: Comprehensive analysis of your presentation against Garr Reynolds' Presentation Zen principles. Validates the 6-word rule, detects text-heavy slides, checks visual balance, and provides kanso-based simplification suggestions.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "doc_name": {
-                            "type": "string",
-                            "description": "Name of the presentation document to validate (optional - defaults to active presentation)"
-                        },
-                        "check_type": {
-                            "type": "string",
-                            "description": "Type of zen validation to perform",
-                            "enum": ["full", "text_simplicity", "text_density", "visual_balance", "kanso_simplicity"],
-                            "default": "full"
-                        },
-                        "slide_range": {
-                            "type": "string",
-                            "description": "Range of slides to check (e.g., '1-5', 'all') - defaults to all slides",
-                            "default": "all"
-                        }
-                    },
-                    "required": [],
-                    "additionalProperties": False
-                }
-            ),
-            Tool(
-                name="detect_text_overload",
-                description="📝 TEXT ANALYZER: Identifies slides with excessive text and suggests conversion to visual formats following zen principles. Detects bullet-point heavy slides and recommends image-based alternatives.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "doc_name": {
-                            "type": "string",
-                            "description": "Presentation document name (optional)"
-                        },
-                        "word_threshold": {
-                            "type": "integer",
-                            "description": "Maximum words per slide (zen recommendation is 15-20 for Spanish)",
-                            "default": 15,
-                            "minimum": 5,
-                            "maximum": 50
-                        },
-                        "provide_alternatives": {
-                            "type": "boolean",
-                            "description": "Include visual alternative suggestions for text-heavy slides",
-                            "default": True
-                        }
-                    },
-                    "required": [],
-                    "additionalProperties": False
-                }
-            ),
-            Tool(
-                name="suggest_story_structure",
-                description="📖 STORY ARCHITECT: Analyzes your presentation content and suggests narrative structure following zen storytelling principles. Identifies key moments for emotional impact and recommends flow improvements.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "presentation_topic": {
-                            "type": "string",
-                            "description": "Main topic or message of your presentation"
-                        },
-                        "target_audience": {
-                            "type": "string",
-                            "description": "Primary audience for the presentation",
-                            "enum": ["executives", "technical", "general", "educational", "creative"],
-                            "default": "general"
-                        },
-                        "presentation_length": {
-                            "type": "integer",
-                            "description": "Number of slides in presentation",
-                            "minimum": 1,
-                            "maximum": 50
-                        },
-                        "emotional_goal": {
-                            "type": "string",
-                            "description": "Primary emotional response you want to evoke",
-                            "enum": ["inspire", "convince", "educate", "entertain", "motivate"],
-                            "default": "convince"
-                        }
-                    },
-                    "required": ["presentation_topic", "presentation_length"],
-                    "additionalProperties": False
-                }
-            ),
-            Tool(
-                name="apply_kanso_principles",
-                description="✨ KANSO OPTIMIZER: Applies zen principles of simplicity and elimination to your slides. Identifies unnecessary elements and suggests refinements for maximum visual impact through subtraction.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "doc_name": {
-                            "type": "string",
-                            "description": "Presentation document name (optional)"
-                        },
-                        "optimization_level": {
-                            "type": "string",
-                            "description": "Level of kanso optimization to apply",
-                            "enum": ["gentle", "moderate", "aggressive"],
-                            "default": "moderate"
-                        },
-                        "preserve_branding": {
-                            "type": "boolean",
-                            "description": "Keep essential branding elements while simplifying",
-                            "default": True
-                        }
-                    },
-                    "required": [],
-                    "additionalProperties": False
-                }
-            ),
-            Tool(
-                name="check_back_row_visibility",
-                description="👀 VISIBILITY VALIDATOR: Ensures your presentation is readable from the back row following zen design principles. Checks font sizes, contrast ratios, and visual hierarchy for optimal audience experience.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "doc_name": {
-                            "type": "string",
-                            "description": "Presentation document name (optional)"
-                        },
-                        "room_size": {
-                            "type": "string",
-                            "description": "Approximate room size for visibility calculations",
-                            "enum": ["small", "medium", "large", "auditorium"],
-                            "default": "medium"
-                        },
-                        "check_contrast": {
-                            "type": "boolean",
-                            "description": "Validate color contrast ratios",
-                            "default": True
-                        }
-                    },
-                    "required": [],
-                    "additionalProperties": False
-                }
-            )
-        ]
+        return list(_zen_tool_schemas())
     
     async def validate_zen_principles(self, doc_name: str = "", check_type: str = "full", slide_range: str = "all") -> List[TextContent]:
         """Validate presentation against zen principles"""
         try:
             # Get slide content for analysis
             slide_content = await self._get_slide_content(doc_name, slide_range)
+            slide_stats = self._precompute_stats(slide_content)
             
-            validation_results = f"🧘 **Zen Validation Results - {check_type.title()} Check**\n\n"
+            parts = [f"🧘 **Zen Validation Results - {check_type.title()} Check**\n\n"]
             
             if check_type in ["full", "text_simplicity"]:
-                text_simplicity_results = self._validate_text_simplicity(slide_content)
-                validation_results += text_simplicity_results + "\n\n"
+                text_simplicity_results = self._validate_text_simplicity(slide_stats)
+                parts.append(text_simplicity_results + "\n\n")
             
             if check_type in ["full", "text_density"]:
-                text_density_results = self._analyze_text_density(slide_content)
-                validation_results += text_density_results + "\n\n"
+                text_density_results = self._analyze_text_density(slide_stats)
+                parts.append(text_density_results + "\n\n")
             
             if check_type in ["full", "visual_balance"]:
                 visual_balance_results = self._check_visual_balance(slide_content)
-                validation_results += visual_balance_results + "\n\n"
+                parts.append(visual_balance_results + "\n\n")
             
             if check_type in ["full", "kanso_simplicity"]:
                 kanso_results = self._assess_kanso_simplicity(slide_content)
-                validation_results += kanso_results + "\n\n"
+                parts.append(kanso_results + "\n\n")
             
             # Overall zen score
             if check_type == "full":
-                zen_score = self._calculate_zen_score(slide_content)
-                validation_results += f"🎯 **Overall Zen Score: {zen_score}/100**\n\n"
-                validation_results += self._get_improvement_recommendations(zen_score)
+                zen_score = self._calculate_zen_score(slide_stats)
+                parts.append(f"🎯 **Overall Zen Score: {zen_score}/100**\n\n")
+                parts.append(self._get_improvement_recommendations(zen_score))
             
             return [TextContent(
                 type="text",
-                text=validation_results
+                text="".join(parts)
             )]
             
         except Exception as e:
@@ -203,12 +305,13 @@ class ZenValidationTools:
         """Detect text-heavy slides and suggest alternatives"""
         try:
             slide_content = await self._get_slide_content(doc_name, "all")
+            slide_stats = self._precompute_stats(slide_content)
             
-            results = f"📝 **Text Overload Analysis (Max: {word_threshold} words per slide)**\n\n"
+            parts = [f"📝 **Text Overload Analysis (Max: {word_threshold} words per slide)**\n\n"]
             
             overloaded_slides = []
             for slide_num, content in slide_content.items():
-                word_count = len(content.split())
+                word_count = slide_stats[slide_num].word_count
                 if word_count > word_threshold:
                     overloaded_slides.append({
                         'slide': slide_num,
@@ -217,29 +320,29 @@ class ZenValidationTools:
                     })
             
             if not overloaded_slides:
-                results += "✅ **Excellent!** All slides follow zen simplicity principles.\n\n"
-                results += f"🧘 **Zen Wisdom**: \"Simplicity is the ultimate sophistication\" - Your presentation embodies this principle."
+                parts.append("✅ **Excellent!** All slides follow zen simplicity principles.\n\n")
+                parts.append(f"🧘 **Zen Wisdom**: \"Simplicity is the ultimate sophistication\" - Your presentation embodies this principle.")
             else:
-                results += f"⚠️ **{len(overloaded_slides)} slides exceed the {word_threshold}-word simplicity limit:**\n\n"
+                parts.append(f"⚠️ **{len(overloaded_slides)} slides exceed the {word_threshold}-word simplicity limit:**\n\n")
                 
                 for slide in overloaded_slides:
-                    results += f"**Slide {slide['slide']}**: {slide['word_count']} words\n"
-                    results += f"Preview: {slide['content']}\n\n"
+                    parts.append(f"**Slide {slide['slide']}**: {slide['word_count']} words\n")
+                    parts.append(f"Preview: {slide['content']}\n\n")
                 
                 if provide_alternatives:
-                    results += "💡 **Zen Transformation Suggestions:**\n"
-                    results += "• Replace bullet points with powerful single images\n"
-                    results += "• Use key phrases instead of full sentences\n"
-                    results += "• Split complex slides into multiple simple ones\n"
-                    results += "• Transform text into visual metaphors\n"
-                    results += "• Use whitespace as a design element\n"
-                    results += "• Focus on one core idea per slide\n\n"
+                    parts.append("💡 **Zen Transformation Suggestions:**\n")
+                    parts.append("• Replace bullet points with powerful single images\n")
+                    parts.append("• Use key phrases instead of full sentences\n")
+                    parts.append("• Split complex slides into multiple simple ones\n")
+                    parts.append("• Transform text into visual metaphors\n")
+                    parts.append("• Use whitespace as a design element\n")
+                    parts.append("• Focus on one core idea per slide\n\n")
                 
-                results += "🎯 **Remember**: The audience reads OR listens, not both simultaneously."
+                parts.append("🎯 **Remember**: The audience reads OR listens, not both simultaneously.")
             
             return [TextContent(
                 type="text",
-                text=results
+                text="".join(parts)
             )]
             
         except Exception as e:
@@ -251,53 +354,48 @@ class ZenValidationTools:
     async def suggest_story_structure(self, presentation_topic: str, target_audience: str = "general", presentation_length: int = 10, emotional_goal: str = "convince") -> List[TextContent]:
         """Suggest narrative structure following zen storytelling principles"""
         try:
-            story_structure = f"📖 **Zen Story Structure for '{presentation_topic}'**\n\n"
-            story_structure += f"🎯 **Audience**: {target_audience.title()} | **Goal**: {emotional_goal.title()} | **Length**: {presentation_length} slides\n\n"
+            parts = [f"📖 **Zen Story Structure for '{presentation_topic}'**\n\n"]
+            parts.append(f"🎯 **Audience**: {target_audience.title()} | **Goal**: {emotional_goal.title()} | **Length**: {presentation_length} slides\n\n")
             
             # Calculate story beats based on presentation length
             story_beats = self._calculate_story_beats(presentation_length)
             
-            story_structure += "🎭 **Narrative Arc (Following Zen Principles):**\n\n"
+            parts.append("🎭 **Narrative Arc (Following Zen Principles):**\n\n")
             
             # Opening (Hook)
-            story_structure += f"**Opening Hook** (Slides 1-{story_beats['hook_end']}):\n"
-            story_structure += "• Start with silence, then ONE powerful image\n"
-            story_structure += "• State the problem/opportunity in 3 words or less\n"
-            story_structure += "• Create emotional connection, not information dump\n\n"
+            parts.append(f"**Opening Hook** (Slides 1-{story_beats['hook_end']}):\n")
+            parts.append("• Start with silence, then ONE powerful image\n")
+            parts.append("• State the problem/opportunity in 3 words or less\n")
+            parts.append("• Create emotional connection, not information dump\n\n")
             
             # Development
-            story_structure += f"**Development** (Slides {story_beats['development_start']}-{story_beats['development_end']}):\n"
-            story_structure += "• Each slide = one key insight\n"
-            story_structure += "• Use visual metaphors over explanations\n"
-            story_structure += "• Build tension through strategic pauses\n"
-            story_structure += "• Follow the 'rule of three' for key points\n\n"
+            parts.append(f"**Development** (Slides {story_beats['development_start']}-{story_beats['development_end']}):\n")
+            parts.append("• Each slide = one key insight\n")
+            parts.append("• Use visual metaphors over explanations\n")
+            parts.append("• Build tension through strategic pauses\n")
+            parts.append("• Follow the 'rule of three' for key points\n\n")
             
             # Climax
-            story_structure += f"**Climax** (Slide {story_beats['climax']}):\n"
-            story_structure += "• The 'aha moment' - your key revelation\n"
-            story_structure += "• Use maximum visual impact\n"
-            story_structure += "• Embrace silence for dramatic effect\n\n"
+            parts.append(f"**Climax** (Slide {story_beats['climax']}):\n")
+            parts.append("• The 'aha moment' - your key revelation\n")
+            parts.append("• Use maximum visual impact\n")
+            parts.append("• Embrace silence for dramatic effect\n\n")
             
             # Resolution
-            story_structure += f"**Resolution** (Slides {story_beats['resolution_start']}-{story_beats['resolution_end']}):\n"
-            story_structure += "• Clear call to action\n"
-            story_structure += "• End with emotion, not logistics\n"
-            story_structure += "• Leave them with ONE memorable image\n\n"
+            parts.append(f"**Resolution** (Slides {story_beats['resolution_start']}-{story_beats['resolution_end']}):\n")
+            parts.append("• Clear call to action\n")
+            parts.append("• End with emotion, not logistics\n")
+            parts.append("• Leave them with ONE memorable image\n\n")
             
             # Zen storytelling tips
-            story_structure += "🧘 **Zen Storytelling Wisdom:**\n"
-            story_structure += "• What you leave out is as important as what you include\n"
-            story_structure += "• Silence is your most powerful tool\n"
-            story_structure += "• The audience should feel, not just think\n"
-            story_structure += "• Every slide should advance the narrative\n"
-            story_structure += "• Trust the audience to connect the dots\n\n"
+            parts.append(_STORY_WISDOM)
             
             # Specific suggestions based on emotional goal
-            story_structure += self._get_emotional_goal_guidance(emotional_goal)
+            parts.append(self._get_emotional_goal_guidance(emotional_goal))
             
             return [TextContent(
                 type="text",
-                text=story_structure
+                text="".join(parts)
             )]
             
         except Exception as e:
@@ -309,16 +407,18 @@ class ZenValidationTools:
     async def apply_kanso_principles(self, doc_name: str = "", optimization_level: str = "moderate", preserve_branding: bool = True) -> List[TextContent]:
         """Apply kanso (simplicity) principles to slides"""
         try:
-            results = f"✨ **Kanso Optimization - {optimization_level.title()} Level**\n\n"
-            results += "🧘 **Kanso Principle**: Beauty through elimination and omission\n\n"
+            parts = [f"✨ **Kanso Optimization - {optimization_level.title()} Level**\n\n"]
+            parts.append("🧘 **Kanso Principle**: Beauty through elimination and omission\n\n")
             
             # Get current slide analysis
-            slide_content = await self._get_slide_content(doc_name, "all")
+            slide_stats = self._precompute_stats(await self._get_slide_content(doc_name, "all"))
             
             optimization_suggestions = []
             
-            for slide_num, content in slide_content.items():
-                slide_suggestions = self._generate_kanso_suggestions(content, optimization_level, preserve_branding)
+            # The level is the same for every slide, so its suggestions are decided once
+            level_suggestions = _KANSO_LEVEL_SUGGESTIONS.get(optimization_level, ())
+            for slide_num, stats in slide_stats.items():
+                slide_suggestions = self._generate_kanso_suggestions(stats, level_suggestions)
                 if slide_suggestions:
                     optimization_suggestions.append({
                         'slide': slide_num,
@@ -326,24 +426,20 @@ class ZenValidationTools:
                     })
             
             if optimization_suggestions:
-                results += "🎯 **Kanso Optimization Recommendations:**\n\n"
+                parts.append("🎯 **Kanso Optimization Recommendations:**\n\n")
                 for suggestion in optimization_suggestions:
-                    results += f"**Slide {suggestion['slide']}:**\n"
+                    parts.append(f"**Slide {suggestion['slide']}:**\n")
                     for rec in suggestion['suggestions']:
-                        results += f"• {rec}\n"
-                    results += "\n"
+                        parts.append(f"• {rec}\n")
+                    parts.append("\n")
             else:
-                results += "✅ **Excellent!** Your presentation already embodies kanso principles.\n\n"
+                parts.append("✅ **Excellent!** Your presentation already embodies kanso principles.\n\n")
             
-            results += "🌸 **Kanso Wisdom:**\n"
-            results += "• Eliminate everything that doesn't serve the message\n"
-            results += "• Empty space is not wasted space\n"
-            results += "• Restraint creates elegance\n"
-            results += "• Less is more powerful\n"
+            parts.append(_KANSO_WISDOM)
             
             return [TextContent(
                 type="text",
-                text=results
+                text="".join(parts)
             )]
             
         except Exception as e:
@@ -355,41 +451,27 @@ class ZenValidationTools:
     async def check_back_row_visibility(self, doc_name: str = "", room_size: str = "medium", check_contrast: bool = True) -> List[TextContent]:
         """Check visibility from back row"""
         try:
-            results = f"👀 **Back Row Visibility Check - {room_size.title()} Room**\n\n"
-            
-            # Room size specifications
-            room_specs = {
-                "small": {"min_font": 24, "distance": "15 feet"},
-                "medium": {"min_font": 32, "distance": "25 feet"},
-                "large": {"min_font": 44, "distance": "40 feet"},
-                "auditorium": {"min_font": 60, "distance": "60+ feet"}
-            }
+            parts = [f"👀 **Back Row Visibility Check - {room_size.title()} Room**\n\n"]
             
-            spec = room_specs[room_size]
-            results += f"📏 **Room Specifications:**\n"
-            results += f"• Minimum font size: {spec['min_font']}pt\n"
-            results += f"• Viewing distance: {spec['distance']}\n\n"
+            spec = _ROOM_SPECS[room_size]
+            parts.append(f"📏 **Room Specifications:**\n")
+            parts.append(f"• Minimum font size: {spec['min_font']}pt\n")
+            parts.append(f"• Viewing distance: {spec['distance']}\n\n")
             
             # Simulate visibility check (would need actual font size detection)
-            results += "⚠️ **Visibility Assessment:**\n"
-            results += "• Font sizes below minimum threshold detected\n"
-            results += "• Some text may be difficult to read from back row\n"
-            results += "• Consider increasing font sizes and simplifying content\n\n"
+            parts.append("⚠️ **Visibility Assessment:**\n")
+            parts.append("• Font sizes below minimum threshold detected\n")
+            parts.append("• Some text may be difficult to read from back row\n")
+            parts.append("• Consider increasing font sizes and simplifying content\n\n")
             
             if check_contrast:
-                results += "🎨 **Color Contrast Guidelines:**\n"
-                results += "• Dark text on light background: minimum 4.5:1 ratio\n"
-                results += "• Light text on dark background: minimum 3:1 ratio\n"
-                results += "• Avoid red/green combinations (colorblind accessibility)\n\n"
+                parts.append(_CONTRAST_GUIDELINES)
             
-            results += "🧘 **Zen Visibility Wisdom:**\n"
-            results += "• Design for the person in the worst seat\n"
-            results += "• If they can't see it, it doesn't exist\n"
-            results += "• Clarity is compassion for your audience\n"
+            parts.append(_VISIBILITY_WISDOM)
             
             return [TextContent(
                 type="text",
-                text=results
+                text="".join(parts)
             )]
             
         except Exception as e:
@@ -402,53 +484,115 @@ class ZenValidationTools:
     
     async def _get_slide_content(self, doc_name: str, slide_range: str) -> Dict[int, str]:
         """Get content from slides for analysis"""
+        start, end = self._parse_slide_range(slide_range)
+        
+        # The front document can change between calls, so only named
+        # documents are cached
+        if not doc_name:
+            return await self._fetch_slide_content(doc_name, start, end)
+        
+        async with self._content_locks.setdefault(doc_name, asyncio.Lock()):
+            cached = self._content_cache.get((doc_name, start, end))
+            if cached is not None and time.monotonic() - cached[0] < _SLIDE_CONTENT_TTL:
+                return cached[1]
+            
+            slide_content = await self._fetch_slide_content(doc_name, start, end)
+            if slide_content is not _SAMPLE_SLIDE_CONTENT:
+                self._content_cache[(doc_name, start, end)] = (time.monotonic(), slide_content)
+            return slide_content
+    
+    @staticmethod
+    def _parse_slide_range(slide_range: str) -> Tuple[int, int]:
+        """
+        Parse a slide range such as 'all', '3' or '1-5'
+        
+        Returns:
+            First and last slide number, or (0, 0) for all slides
+        
+        Raises:
+            ParameterError: If the range is not in one of those forms
+        """
+        slide_range = (slide_range or "all").strip().lower()
+        if slide_range == "all":
+            return 0, 0
+        
+        first, _, last = slide_range.partition("-")
         try:
-            # Use AppleScript to get actual slide content
-            script_file = "zen_analysis.applescript"
-            function_name = "getSlideTextContent"
-            params = [doc_name] if doc_name else [""]
-            
-            result = await self.runner.run_function(script_file, function_name, params)
-            
-            if result and "error" not in result:
-                import json
-                slide_data = json.loads(result)
-                
-                # Convert to dictionary format expected by validation functions
-                slide_content = {}
-                for slide_info in slide_data:
-                    slide_num = slide_info.get("slideNumber", 0)
-                    text_content = slide_info.get("textContent", "")
-                    slide_content[slide_num] = text_content
-                
-                return slide_content
-            else:
-                # Fallback to mock data if AppleScript fails
-                return {
-                    1: "Welcome to our quarterly review meeting presentation",
-                    2: "Our key objectives for this quarter include increasing sales by 15%, improving customer satisfaction scores, and launching two new product lines",
-                    3: "Sales Performance Dashboard showing multiple metrics and charts",
-                    4: "Customer Feedback Analysis with detailed bullet points and statistics",
-                    5: "Next Steps and Action Items for the upcoming quarter"
-                }
-        except Exception as e:
-            # Fallback to mock data if there's an error
-            return {
-                1: "Welcome to our quarterly review meeting presentation",
-                2: "Our key objectives for this quarter include increasing sales by 15%, improving customer satisfaction scores, and launching two new product lines",
-                3: "Sales Performance Dashboard showing multiple metrics and charts",
-                4: "Customer Feedback Analysis with detailed bullet points and statistics",
-                5: "Next Steps and Action Items for the upcoming quarter"
-            }
+            start = int(first)
+            end = int(last) if last else start
+        except ValueError:
+            raise ParameterError(f"Invalid slide range: {slide_range}. Use 'all', 'N' or 'N-M'.")
+        
+        if start < 1 or end < start:
+            raise ParameterError(f"Invalid slide range: {slide_range}. Use 'all', 'N' or 'N-M'.")
+        return start, end
     
-    def _validate_text_simplicity(self, slide_content: Dict[int, str]) -> str:
+    async def _fetch_slide_content(self, doc_name: str, start: int, end: int) -> Dict[int, str]:
+        """
+        Read the text of slides start through end from Keynote, or the sample content if that fails
+        
+        Raises:
+            ParameterError: If the range starts past the last slide
+        """
+        try:
+            # One handler call returns the range's text as a JSON array
+            result = await self.runner.run_handler_async(
+                script_file="zen_analysis.applescript",
+                function_name="getSlideTextContent",
+                args=[doc_name, start, end]
+            )
+            slide_data = _json.loads(result) if result else None
+        except Exception:
+            slide_data = None
+        
+        if isinstance(slide_data, dict) and "slideCount" in slide_data:
+            slide_count = slide_data["slideCount"]
+            if start:
+                raise ParameterError(f"Invalid slide range: {start}-{end} is beyond the {slide_count} slides in the presentation")
+            # "all" on a presentation with no slides
+            return {}
+        
+        if not isinstance(slide_data, list):
+            # Fallback to sample data if AppleScript fails
+            return _SAMPLE_SLIDE_CONTENT
+        
+        # Convert to dictionary format expected by validation functions
+        return {
+            slide_info.get("slideNumber", 0): slide_info.get("textContent", "")
+            for slide_info in slide_data
+        }
+    
+    def invalidate_cache(self, doc_name: str = "") -> None:
+        """Drop cached slide text for one document, or all documents when no name is given"""
+        if doc_name:
+            for key in [key for key in self._content_cache if key[0] == doc_name]:
+                del self._content_cache[key]
+        else:
+            self._content_cache.clear()
+    
+    @staticmethod
+    def _precompute_stats(slide_content: Dict[int, str]) -> Dict[int, _SlideStats]:
+        """Measure every slide's text once for all the checks of a request"""
+        slide_stats = {}
+        for slide_num, content in slide_content.items():
+            # With whitespace collapsed, words are one more than the spaces
+            normalized = _WHITESPACE_RE.sub(' ', content).strip()
+            slide_stats[slide_num] = _SlideStats(
+                word_count=normalized.count(' ') + 1 if normalized else 0,
+                sentence_count=sum(1 for _ in _SENTENCE_RE.finditer(content)),
+                bullet_count=content.count('•'),
+                mentions_bullet=_BULLET_WORD_RE.search(content) is not None
+            )
+        return slide_stats
+    
+    def _validate_text_simplicity(self, slide_stats: Dict[int, _SlideStats]) -> str:
         """Validate text simplicity following zen principles"""
         results = "📏 **Text Simplicity Validation:**\n"
         complex_slides = []
         
-        for slide_num, content in slide_content.items():
-            word_count = len(content.split())
-            sentence_count = len([s for s in content.split('.') if s.strip()])
+        for slide_num, stats in slide_stats.items():
+            word_count = stats.word_count
+            sentence_count = stats.sentence_count
             
             # Check for complexity indicators
             is_complex = False
@@ -462,7 +606,7 @@ class ZenValidationTools:
                 is_complex = True
                 complexity_reasons.append(f"Muchas oraciones ({sentence_count})")
                 
-            if content.count('•') > 5:
+            if stats.bullet_count > 5:
                 is_complex = True
                 complexity_reasons.append("Demasiados bullet points")
             
@@ -482,12 +626,12 @@ class ZenValidationTools:
         
         return results
     
-    def _analyze_text_density(self, slide_content: Dict[int, str]) -> str:
+    def _analyze_text_density(self, slide_stats: Dict[int, _SlideStats]) -> str:
         """Analyze text density across slides"""
         results = "📊 **Text Density Analysis:**\n"
         
-        total_words = sum(len(content.split()) for content in slide_content.values())
-        avg_words = total_words / len(slide_content)
+        total_words = sum(stats.word_count for stats in slide_stats.values())
+        avg_words = total_words / len(slide_stats) if slide_stats else 0.0
         
         results += f"• Average words per slide: {avg_words:.1f}\n"
         results += f"• Total words: {total_words}\n"
@@ -519,19 +663,21 @@ class ZenValidationTools:
         
         return results
     
-    def _calculate_zen_score(self, slide_content: Dict[int, str]) -> int:
+    def _calculate_zen_score(self, slide_stats: Dict[int, _SlideStats]) -> int:
         """Calculate overall zen score"""
         score = 100
         
-        # Deduct points for violations
-        for content in slide_content.values():
-            word_count = len(content.split())
+        # Deduct points for violations, stopping once nothing is left to deduct
+        for stats in slide_stats.values():
+            word_count = stats.word_count
             if word_count > 20:
                 score -= 15
             elif word_count > 15:
                 score -= 10
+            if score <= 0:
+                return 0
         
-        return max(0, score)
+        return score
     
     def _get_improvement_recommendations(self, zen_score: int) -> str:
         """Get improvement recommendations based on zen score"""
@@ -544,8 +690,10 @@ class ZenValidationTools:
         else:
             return "🚨 **Major revision needed.** Consider complete redesign using zen principles."
     
-    def _calculate_story_beats(self, presentation_length: int) -> Dict[str, int]:
-        """Calculate story structure beats based on presentation length"""
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _calculate_story_beats(presentation_length: int) -> Dict[str, int]:
+        """Calculate story structure beats based on presentation length (cached; callers must not modify the result)"""
         return {
             'hook_end': max(1, presentation_length // 5),
             'development_start': max(2, presentation_length // 5 + 1),
@@ -557,28 +705,17 @@ class ZenValidationTools:
     
     def _get_emotional_goal_guidance(self, emotional_goal: str) -> str:
         """Get specific guidance based on emotional goal"""
-        guidance = {
-            "inspire": "🌟 **Inspiration Focus**: Use aspirational imagery, success stories, and future vision",
-            "convince": "💪 **Persuasion Focus**: Build logical progression, address objections, use social proof",
-            "educate": "🎓 **Education Focus**: Break complex ideas into simple concepts, use analogies",
-            "entertain": "🎭 **Entertainment Focus**: Use humor, surprising facts, engaging narratives",
-            "motivate": "🚀 **Motivation Focus**: Create urgency, show benefits, inspire action"
-        }
-        
-        return guidance.get(emotional_goal, "🎯 **General Focus**: Clear message, strong visuals, memorable ending")
+        return _EMOTIONAL_GOAL_GUIDANCE.get(emotional_goal, "🎯 **General Focus**: Clear message, strong visuals, memorable ending")
     
-    def _generate_kanso_suggestions(self, content: str, optimization_level: str, preserve_branding: bool) -> List[str]:
+    def _generate_kanso_suggestions(self, stats: _SlideStats, level_suggestions: Tuple[str, ...]) -> List[str]:
         """Generate kanso optimization suggestions"""
         suggestions = []
         
-        word_count = len(content.split())
-        if word_count > 6:
+        if stats.word_count > 6:
             suggestions.append("Reduce text to 6 words or less")
         
-        if "bullet" in content.lower():
+        if stats.mentions_bullet:
             suggestions.append("Replace bullet points with single powerful image")
         
-        if optimization_level == "aggressive":
-            suggestions.append("Consider eliminating this slide entirely")
-        
+        suggestions.extend(level_suggestions)
         return suggestions
\ No newline at end of file
@@ -2,7 +2,7 @@
 Utility modules for Keynote-MCP
 """
 
-from .applescript_runner import AppleScriptRunner
+from .applescript_runner import AppleScriptRunner, applescript_string
 from .error_handler import (
     KeynoteError, 
     AppleScriptError, 
@@ -15,6 +15,7 @@ from .error_handler import (
 
 __all__ = [
     'AppleScriptRunner', 
+    'applescript_string',
     'KeynoteError', 
     'AppleScriptError', 
     'FileOperationError',
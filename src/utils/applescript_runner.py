@@ -2,19 +2,101 @@
 AppleScript runner utilities
 """
 
+import asyncio
 import subprocess
-import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 from pathlib import Path
 from typing import Any, Optional
 import os
-import tempfile
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+    import json
 
 from .error_handler import AppleScriptError
+from .osakit_backend import OSAKitBackend, application_running, osakit_available
+from .script_host import ScriptHostPool
+from .scripting_bridge import KeynoteBridge, scripting_bridge_available
+
+
+# Bundled AppleScript files
+_DEFAULT_SCRIPT_DIR = Path(__file__).parent.parent / "applescript"
+
+# Compiled handler wrappers are cached here and reused across server runs
+_COMPILED_CACHE_DIR = Path.home() / ".cache" / "keynote-mcp"
+
+# How each argv item is coerced before being passed to the handler
+_ARGV_COERCIONS = {
+    "text": "item {i} of argv",
+    "integer": "(item {i} of argv) as integer",
+    "real": "(item {i} of argv) as real",
+    "boolean": "(item {i} of argv) is \"true\"",
+}
+
+# Seconds a positive "Keynote is running" check is trusted
+_KEYNOTE_RUNNING_TTL = 30.0
+
+_KEYNOTE_BUNDLE_ID = "com.apple.iWork.Keynote"
+
+# Number of persistent osascript hosts, and of executor workers when OSAKit is not in use
+_HOST_POOL_SIZE = 2
+
+# Set to force the osascript subprocess path even when OSAKit or ScriptingBridge is installed
+_FORCE_OSASCRIPT_ENV = 'KEYNOTE_MCP_FORCE_OSASCRIPT'
+
+
+def applescript_string(value: str) -> str:
+    """
+    Quote a Python string as an AppleScript string literal
+    
+    Backslashes and double quotes are escaped so values such as file paths or
+    titles containing quotes cannot break out of the literal.
+    """
+    if '"' not in value and '\\' not in value:
+        # Most values need no escaping; skip building two replaced copies
+        return f'"{value}"'
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode osascript output as UTF-8, never failing on stray bytes"""
+    return data.decode('utf-8', 'replace').strip()
+
+
+def _format_json_arg(arg: Any) -> str:
+    """Serialize a dict or list argument as JSON"""
+    return orjson.dumps(arg).decode('utf-8') if orjson else json.dumps(arg)
+
+
+def _format_other_arg(arg: Any) -> str:
+    """Format an argument whose exact type has no entry in _ARG_FORMATTERS"""
+    if isinstance(arg, (dict, list)):
+        return _format_json_arg(arg)
+    return str(arg)
+
+
+# run_script argument formatters, looked up by exact type so bool never
+# reaches int's entry; subclasses of other types go through _format_other_arg
+_ARG_FORMATTERS = {
+    str: str,
+    int: str,
+    float: str,
+    bool: lambda arg: "true" if arg else "false",
+    type(None): lambda arg: "missing value",
+    dict: _format_json_arg,
+    list: _format_json_arg,
+}
 
 
 class AppleScriptRunner:
     """AppleScript executor"""
     
+    _instance: Optional["AppleScriptRunner"] = None
+    
     def __init__(self, script_dir: Optional[Path] = None) -> None:
         """
         Initialize AppleScript executor
@@ -22,18 +104,67 @@ class AppleScriptRunner:
         Args:
             script_dir: AppleScript script directory path
         """
-        if script_dir is None:
-            # Default script directory
-            current_dir = Path(__file__).parent.parent
-            script_dir = current_dir / "applescript"
+        self.script_dir = Path(script_dir) if script_dir is not None else _DEFAULT_SCRIPT_DIR
+        self._compiled_handlers: dict[tuple, Path] = {}
+        self._source_cache: dict[Path, tuple[float, str]] = {}
+        
+        # Run scripts in-process when pyobjc's OSAKit is installed, which
+        # avoids an osascript spawn and recompilation on every call
+        self._osakit: Optional[OSAKitBackend] = None
+        if osakit_available() and not os.environ.get(_FORCE_OSASCRIPT_ENV):
+            self._osakit = OSAKitBackend()
         
-        self.script_dir = Path(script_dir)
-        self._ensure_script_dir()
+        # Otherwise scripts go to long-lived osascript host processes, one
+        # per executor worker, falling back to a process per call if the
+        # hosts cannot run
+        self._host: Optional[ScriptHostPool] = None
+        if self._osakit is None and not os.environ.get(_FORCE_OSASCRIPT_ENV):
+            self._host = ScriptHostPool(self.script_dir / "script_host.js", _HOST_POOL_SIZE)
+        
+        # Read-only queries skip AppleScript entirely when pyobjc's
+        # ScriptingBridge is installed; tools fall back to handlers otherwise
+        self.bridge: Optional[KeynoteBridge] = None
+        if scripting_bridge_available() and not os.environ.get(_FORCE_OSASCRIPT_ENV):
+            self.bridge = KeynoteBridge(_KEYNOTE_BUNDLE_ID)
+        
+        self._keynote_running_until = 0.0
+        
+        # Scripts run off the event loop on a small pool; Keynote handles
+        # Apple Events one at a time, and OSAKit scripts must not be run
+        # from several threads at once, so it gets a single worker
+        self._executor = ThreadPoolExecutor(
+            max_workers=1 if self._osakit is not None else _HOST_POOL_SIZE,
+            thread_name_prefix="applescript"
+        )
+        
+        self._script_index: dict[str, Path] = {}
+        self._index_scripts()
     
-    def _ensure_script_dir(self) -> None:
-        """Ensure script directory exists"""
-        if not self.script_dir.exists():
-            self.script_dir.mkdir(parents=True, exist_ok=True)
+    @classmethod
+    def instance(cls) -> "AppleScriptRunner":
+        """
+        Return the process-wide runner for the default script directory
+        
+        Tools share it so compiled scripts and the OSAKit backend are set up
+        once per process.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def _index_scripts(self) -> None:
+        """Map each script's bare name to its file with one directory listing, preferring .scpt"""
+        index: dict[str, Path] = {}
+        try:
+            with os.scandir(self.script_dir) as entries:
+                for entry in entries:
+                    name, ext = os.path.splitext(entry.name)
+                    if ext == '.scpt' or (ext == '.applescript' and name not in index):
+                        index[name] = Path(entry.path)
+        except FileNotFoundError:
+            # No scripts yet; run_script reports the missing script
+            pass
+        self._script_index = index
     
     def run_script(self, script_name: str, function_name: str, *args) -> str:
         """
@@ -50,12 +181,14 @@ class AppleScriptRunner:
         Raises:
             AppleScriptError: Script execution error
         """
-        # Try .scpt first, then .applescript
-        script_path = self.script_dir / f"{script_name}.scpt"
-        if not script_path.exists():
-            script_path = self.script_dir / f"{script_name}.applescript"
+        # .scpt is preferred over .applescript; the index is rebuilt once
+        # on a miss in case the script was added since it was built
+        script_path = self._script_index.get(script_name)
+        if script_path is None:
+            self._index_scripts()
+            script_path = self._script_index.get(script_name)
         
-        if not script_path.exists():
+        if script_path is None:
             raise AppleScriptError(f"Script file not found: {script_name} (tried .scpt and .applescript)")
         
         # If it's a .applescript file, read and execute directly
@@ -77,28 +210,25 @@ class AppleScriptRunner:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 check=True
             )
             
-            return result.stdout.strip()
+            return _decode_output(result.stdout)
             
         except subprocess.CalledProcessError as e:
-            raise AppleScriptError(f"AppleScript execution failed: {e.stderr.strip()}")
+            raise AppleScriptError(f"AppleScript execution failed: {_decode_output(e.stderr)}")
         except Exception as e:
             raise AppleScriptError(f"Unexpected error during script execution: {str(e)}")
     
     def _execute_applescript_file(self, script_path: Path, function_name: str, *args) -> str:
         """
-        Execute AppleScript file directly
+        Call a handler in an AppleScript source file through its compiled wrapper
         
         Returns:
             Script execution result
         """
         try:
-            # Execute AppleScript code
-            script_content = script_path.read_text(encoding='utf-8')
-            return self.execute_script(script_content)
+            return self.run_handler(script_path.name, function_name, list(args))
             
         except Exception as e:
             raise AppleScriptError(f"Failed to execute AppleScript file: {str(e)}")
@@ -113,26 +243,134 @@ class AppleScriptRunner:
         Returns:
             Execution result
         """
+        if self._osakit is not None:
+            try:
+                return self._osakit.execute_source(script_code)
+            except AppleScriptError:
+                # Keynote may have quit; re-probe on the next running check
+                self._keynote_running_until = 0.0
+                raise
+        
+        host = self._host
+        if host is not None:
+            try:
+                return host.execute(script_code)
+            except AppleScriptError:
+                self._keynote_running_until = 0.0
+                raise
+            except OSError:
+                # The host could not be started or reached; stop using it
+                host.close()
+                self._host = None
+        
         try:
-            # Use osascript to execute AppleScript
+            # Feed the script to osascript on stdin; large scripts would
+            # otherwise run into the argv size limit
             result = subprocess.run(
-                ["osascript", "-e", script_code],
+                ["osascript", "-"],
+                input=script_code,
                 capture_output=True,
-                text=True,
                 check=True
             )
             
-            return result.stdout.strip()
+            return _decode_output(result.stdout)
             
         except subprocess.CalledProcessError as e:
-            raise AppleScriptError(f"AppleScript execution failed: {e.stderr.strip()}")
+            self._keynote_running_until = 0.0
+            raise AppleScriptError(f"AppleScript execution failed: {_decode_output(e.stderr)}")
         except Exception as e:
             raise AppleScriptError(f"Unexpected error during script execution: {str(e)}")
     
+    def run_batch(self, ops: list[str], prelude: str = "") -> list[str]:
+        """
+        Run several AppleScript snippets in one script execution
+        
+        Each snippet becomes the body of its own handler, so it may use
+        tell blocks and should end with a return statement. A snippet that
+        raises yields "error: <message>" in its slot, and the remaining
+        snippets still run.
+        
+        Args:
+            ops: AppleScript snippets to run, in order
+            prelude: Handlers the snippets call (with "my"), included once
+            
+        Returns:
+            One result string per snippet
+        """
+        if not ops:
+            return []
+        
+        handlers = "\n\n".join(
+            f"on batchOp{i}()\n{body}\nend batchOp{i}"
+            for i, body in enumerate(ops, 1)
+        )
+        calls = "\n".join(
+            f"""try
+    set end of batchResults to (batchOp{i}() as text)
+on error errMsg
+    set end of batchResults to "error: " & errMsg
+end try"""
+            for i in range(1, len(ops) + 1)
+        )
+        script = f"""{prelude}
+
+{handlers}
+
+set batchResults to {{}}
+{calls}
+
+set AppleScript's text item delimiters to (character id 30)
+set batchOutput to batchResults as string
+set AppleScript's text item delimiters to ""
+return "batch:" & batchOutput"""
+        
+        # str.strip() treats the separator as whitespace, so the output is
+        # prefixed to keep a leading empty result, and trailing empty results
+        # trimmed by the runner are restored by padding
+        output = self.execute_script(script)
+        results = output[len("batch:"):].split("\x1e")
+        return results + [""] * (len(ops) - len(results))
+    
+    async def run_batch_async(self, ops: list[str], prelude: str = "") -> list[str]:
+        """Run a batch of snippets on the runner's executor without blocking the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.run_batch, ops, prelude
+        )
+    
+    def read_script(self, script_file: str) -> str:
+        """
+        Read an AppleScript file's source
+        
+        The source is kept in memory and re-read only when the file's
+        modification time changes.
+        
+        Args:
+            script_file: AppleScript file name (with extension)
+            
+        Returns:
+            Script source
+        """
+        script_path = self.script_dir / script_file
+        try:
+            mtime = script_path.stat().st_mtime
+        except FileNotFoundError:
+            raise AppleScriptError(f"Script file not found: {script_file}")
+        
+        cached = self._source_cache.get(script_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        source = script_path.read_text(encoding='utf-8')
+        self._source_cache[script_path] = (mtime, source)
+        return source
+    
     def run_function(self, script_file: str, function_name: str, args: list) -> str:
         """
         Run a specific function from an AppleScript file with arguments
         
+        Goes through run_handler, so the file is compiled once rather than
+        sent as source with the call appended on every run.
+        
         Args:
             script_file: AppleScript file name (with extension)
             function_name: Function name to call
@@ -141,44 +379,235 @@ class AppleScriptRunner:
         Returns:
             Script execution result
         """
-        script_path = self.script_dir / script_file
+        try:
+            return self.run_handler(script_file, function_name, args)
+        except Exception as e:
+            raise AppleScriptError(f"Failed to execute function {function_name} in {script_file}: {str(e)}")
+    
+    def run_handler(self, script_file: str, function_name: str, args: list) -> str:
+        """
+        Run a handler from an AppleScript file through a compiled wrapper
         
-        if not script_path.exists():
-            raise AppleScriptError(f"Script file not found: {script_file}")
+        The wrapper is compiled once per handler and argument types, and the
+        arguments are passed as osascript argv, so repeated calls skip
+        AppleScript compilation and no values are interpolated into source.
+        With OSAKit available the handler is called in-process instead.
         
-        try:
-            # Read the script content
-            script_content = script_path.read_text(encoding='utf-8')
-            
-            # Format the arguments for AppleScript
-            formatted_args = []
-            for arg in args:
-                if isinstance(arg, str):
-                    # Escape quotes in string arguments
-                    escaped_arg = arg.replace('"', '\\"')
-                    formatted_args.append(f'"{escaped_arg}"')
-                elif isinstance(arg, (int, float)):
-                    formatted_args.append(str(arg))
-                elif isinstance(arg, bool):
-                    formatted_args.append("true" if arg else "false")
-                elif arg is None or arg == "":
-                    formatted_args.append('""')
-                else:
-                    formatted_args.append(str(arg))
-            
-            # Create the function call
-            args_str = ", ".join(formatted_args)
-            function_call = f"{function_name}({args_str})"
+        Args:
+            script_file: AppleScript file name (with extension)
+            function_name: Handler name to call
+            args: List of arguments (str, int, float, bool or None)
             
-            # Combine script content with function call
-            full_script = f"{script_content}\n\n{function_call}"
+        Returns:
+            Script execution result
+        """
+        if self._osakit is not None:
+            script_path = self.script_dir / script_file
+            if not script_path.exists():
+                raise AppleScriptError(f"Script file not found: {script_file}")
+            try:
+                return self._osakit.call_handler(script_path, function_name, args)
+            except AppleScriptError:
+                self._keynote_running_until = 0.0
+                raise
+        
+        cmd = self._handler_command(script_file, function_name, args)
+        
+        if self._host is not None:
+            # Load the same compiled wrapper inside the host process
+            params = ", ".join(applescript_string(arg) for arg in cmd[2:])
+            return self.execute_script(
+                f"return run script (POSIX file {applescript_string(cmd[1])}) with parameters {{{params}}}"
+            )
+        
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                check=True
+            )
             
-            # Execute the script
-            return self.execute_script(full_script)
+            return _decode_output(result.stdout)
             
+        except subprocess.CalledProcessError as e:
+            self._keynote_running_until = 0.0
+            raise AppleScriptError(f"AppleScript execution failed: {_decode_output(e.stderr)}")
+        except Exception as e:
+            raise AppleScriptError(f"Unexpected error during script execution: {str(e)}")
+    
+    async def run_handler_async(self, script_file: str, function_name: str, args: list) -> str:
+        """
+        Run a handler without blocking the event loop
+        
+        In-process and host-backed execution run on the runner's executor;
+        the plain osascript path awaits the subprocess directly, compiling
+        the handler wrapper on the executor the first time.
+        """
+        loop = asyncio.get_running_loop()
+        if self._osakit is not None or self._host is not None:
+            return await loop.run_in_executor(
+                self._executor, self.run_handler, script_file, function_name, args
+            )
+        
+        cmd = await loop.run_in_executor(
+            self._executor, self._handler_command, script_file, function_name, args
+        )
+        return await self._run_osascript_async(cmd)
+    
+    async def run_function_async(self, script_file: str, function_name: str, args: list) -> str:
+        """Run a script function without blocking the event loop (see run_handler_async)"""
+        try:
+            return await self.run_handler_async(script_file, function_name, args)
         except Exception as e:
             raise AppleScriptError(f"Failed to execute function {function_name} in {script_file}: {str(e)}")
     
+    async def run_bridge_async(self, query: str, *args: Any) -> Any:
+        """
+        Run a KeynoteBridge query on the runner's executor
+        
+        Args:
+            query: KeynoteBridge method name
+            *args: Query arguments
+            
+        Returns:
+            The query result
+        """
+        def run() -> Any:
+            try:
+                return getattr(self.bridge, query)(*args)
+            except AppleScriptError:
+                self._keynote_running_until = 0.0
+                raise
+            except Exception as e:
+                self._keynote_running_until = 0.0
+                raise AppleScriptError(f"Keynote query failed: {str(e)}")
+        
+        return await asyncio.get_running_loop().run_in_executor(self._executor, run)
+    
+    async def execute_script_async(self, script_code: str) -> str:
+        """
+        Execute AppleScript code without blocking the event loop
+        
+        In-process and host-backed execution run on the runner's executor;
+        the plain osascript path awaits the subprocess directly, so
+        independent scripts can be overlapped with asyncio.gather.
+        """
+        if self._osakit is not None or self._host is not None:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, self.execute_script, script_code
+            )
+        
+        return await self._run_osascript_async(["osascript", "-"], script_code)
+    
+    async def run_inline_script_async(self, script_code: str) -> str:
+        """Run inline AppleScript without blocking the event loop (alias for execute_script_async)"""
+        return await self.execute_script_async(script_code)
+    
+    async def _run_osascript_async(self, cmd: list[str], script_code: Optional[str] = None) -> str:
+        """Run an osascript command as an asyncio subprocess and return its output"""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE if script_code is not None else asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await process.communicate(
+                script_code.encode('utf-8') if script_code is not None else None
+            )
+        except Exception as e:
+            raise AppleScriptError(f"Unexpected error during script execution: {str(e)}")
+        
+        if process.returncode != 0:
+            self._keynote_running_until = 0.0
+            raise AppleScriptError(f"AppleScript execution failed: {_decode_output(stderr)}")
+        return _decode_output(stdout)
+    
+    def precompile(self, *script_files: str) -> None:
+        """
+        Compile AppleScript files ahead of their first call
+        
+        Only applies to the OSAKit backend, where a compiled file serves every
+        handler in it; the osascript path compiles per handler on first use.
+        
+        Args:
+            *script_files: AppleScript file names (with extension)
+        """
+        if self._osakit is None:
+            return
+        
+        for script_file in script_files:
+            script_path = self.script_dir / script_file
+            if not script_path.exists():
+                raise AppleScriptError(f"Script file not found: {script_file}")
+            self._osakit.load_file(script_path)
+    
+    def _handler_command(self, script_file: str, function_name: str, args: list) -> list[str]:
+        """Build the osascript command line for a compiled handler call"""
+        arg_types = tuple(self._argv_type(arg) for arg in args)
+        compiled_path = self._compiled_handlers.get((script_file, function_name, arg_types))
+        if compiled_path is None:
+            compiled_path = self._compile_handler(script_file, function_name, arg_types)
+        
+        return ["osascript", str(compiled_path)] + [self._argv_value(arg) for arg in args]
+    
+    def _compile_handler(self, script_file: str, function_name: str, arg_types: tuple) -> Path:
+        """
+        Compile a script file plus an argv dispatching run handler to .scpt
+        
+        Returns:
+            Path of the compiled script in the cache directory
+        """
+        params = ", ".join(
+            _ARGV_COERCIONS[arg_type].format(i=i)
+            for i, arg_type in enumerate(arg_types, 1)
+        )
+        source = (
+            self.read_script(script_file)
+            + f"\n\non run argv\n    return {function_name}({params})\nend run\n"
+        )
+        
+        # Key on the full source so edits to the script produce a new build
+        digest = hashlib.blake2b(source.encode('utf-8'), digest_size=16).hexdigest()
+        compiled_path = _COMPILED_CACHE_DIR / f"{digest}.scpt"
+        
+        if not compiled_path.exists():
+            _COMPILED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = _COMPILED_CACHE_DIR / f"{digest}.{os.getpid()}.tmp.scpt"
+            try:
+                subprocess.run(
+                    ["osacompile", "-o", str(tmp_path)],
+                    input=source.encode('utf-8'),
+                    capture_output=True,
+                    check=True
+                )
+                os.replace(tmp_path, compiled_path)
+            except subprocess.CalledProcessError as e:
+                raise AppleScriptError(f"Failed to compile {function_name} in {script_file}: {_decode_output(e.stderr)}")
+        
+        self._compiled_handlers[(script_file, function_name, arg_types)] = compiled_path
+        return compiled_path
+    
+    @staticmethod
+    def _argv_type(arg: Any) -> str:
+        """Map a Python argument to the AppleScript type it is coerced to"""
+        if isinstance(arg, bool):
+            return "boolean"
+        if isinstance(arg, int):
+            return "integer"
+        if isinstance(arg, float):
+            return "real"
+        return "text"
+    
+    @staticmethod
+    def _argv_value(arg: Any) -> str:
+        """Convert a Python argument to its argv string form"""
+        if isinstance(arg, bool):
+            return "true" if arg else "false"
+        if arg is None:
+            return ""
+        return str(arg)
+    
     def run_inline_script(self, script_code: str) -> str:
         """
         Execute inline AppleScript code (alias for execute_script)
@@ -195,19 +624,49 @@ class AppleScriptRunner:
         """
         Check if Keynote application is running
         
+        Uses keynote_running_hint's memo and only asks System Events when
+        that cannot answer.
+        
         Returns:
             True if Keynote is running, False otherwise
         """
+        running = self.keynote_running_hint()
+        if running is not None:
+            return running
+        
         try:
             script = '''
                 tell application "System Events"
                     return (name of processes) contains "Keynote"
                 end tell
             '''
-            result = self.execute_script(script)
-            return result.lower() == "true"
+            running = self.execute_script(script).lower() == "true"
         except Exception:
-            return False
+            running = False
+        
+        if running:
+            self._mark_keynote_running()
+        return running
+    
+    def keynote_running_hint(self) -> Optional[bool]:
+        """
+        Check if Keynote is running without spawning any process
+        
+        Returns:
+            True or False, or None when this cannot be answered cheaply
+            (AppKit unavailable and no cached positive result)
+        """
+        if time.monotonic() < self._keynote_running_until:
+            return True
+        
+        running = application_running(_KEYNOTE_BUNDLE_ID)
+        if running:
+            self._mark_keynote_running()
+        return running
+    
+    def _mark_keynote_running(self) -> None:
+        """Trust that Keynote is running for the next _KEYNOTE_RUNNING_TTL seconds"""
+        self._keynote_running_until = time.monotonic() + _KEYNOTE_RUNNING_TTL
     
     def launch_keynote(self) -> None:
         """
@@ -223,6 +682,7 @@ class AppleScriptRunner:
                 end tell
             '''
             self.execute_script(script)
+            self._mark_keynote_running()
         except Exception as e:
             raise AppleScriptError(f"Failed to launch Keynote: {str(e)}")
     
@@ -236,29 +696,11 @@ class AppleScriptRunner:
         Returns:
             Formatted argument list
         """
-        formatted_args = []
-        for arg in args:
-            if isinstance(arg, (dict, list)):
-                # Convert complex objects to JSON strings
-                formatted_args.append(json.dumps(arg))
-            elif isinstance(arg, bool):
-                # Convert boolean to AppleScript format
-                formatted_args.append("true" if arg else "false")
-            elif isinstance(arg, (int, float)):
-                # Keep numbers as strings
-                formatted_args.append(str(arg))
-            elif arg is None:
-                # Handle None values
-                formatted_args.append("missing value")
-            else:
-                # Handle strings and other types
-                formatted_args.append(str(arg))
-        
-        return formatted_args
+        return [_ARG_FORMATTERS.get(type(arg), _format_other_arg)(arg) for arg in args]
 
 
 # Global instance for easy access
-applescript_runner = AppleScriptRunner()
+applescript_runner = AppleScriptRunner.instance()
 
 
 def run_applescript(script_name: str, function_name: str, *args) -> str:
@@ -32,6 +32,7 @@ def handle_applescript_error(error_output: str) -> None:
         return
     
     error_output = error_output.strip()
+    lowered = error_output.lower()
     
     # Keynote application errors
     if "Keynote got an error" in error_output:
@@ -42,15 +43,15 @@ def handle_applescript_error(error_output: str) -> None:
         raise AppleScriptError(f"Object not found: {error_output}")
     
     # Permission errors
-    elif "not allowed" in error_output or "permission" in error_output.lower():
+    elif "not allowed" in error_output or "permission" in lowered:
         raise AppleScriptError(f"Permission denied: {error_output}")
     
     # File operation errors
-    elif "file" in error_output.lower() and ("not found" in error_output.lower() or "doesn't exist" in error_output.lower()):
+    elif "file" in lowered and ("not found" in lowered or "doesn't exist" in lowered):
         raise FileOperationError(f"File operation error: {error_output}")
     
     # Syntax errors
-    elif "syntax error" in error_output.lower():
+    elif "syntax error" in lowered:
         raise AppleScriptError(f"AppleScript syntax error: {error_output}")
     
     # Other errors
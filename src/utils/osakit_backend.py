@@ -0,0 +1,173 @@
+"""
+In-process AppleScript execution through OSAKit (pyobjc)
+"""
+
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from .error_handler import AppleScriptError
+
+try:
+    from Foundation import NSAppleEventDescriptor
+    from OSAKit import OSALanguage, OSAScript
+except ImportError:  # pyobjc is only available on macOS
+    OSAScript = None
+
+try:
+    from AppKit import NSRunningApplication
+except ImportError:
+    NSRunningApplication = None
+
+
+# Number of distinct inline scripts kept compiled
+_INLINE_CACHE_SIZE = 64
+
+
+def osakit_available() -> bool:
+    """Return True if the pyobjc OSAKit bindings can be imported"""
+    return OSAScript is not None
+
+
+def application_running(bundle_id: str) -> Optional[bool]:
+    """
+    Check whether an application is running without sending an Apple Event
+    
+    Returns:
+        True or False, or None when AppKit is not available
+    """
+    if NSRunningApplication is None:
+        return None
+    return len(NSRunningApplication.runningApplicationsWithBundleIdentifier_(bundle_id)) > 0
+
+
+class OSAKitBackend:
+    """Compiles and runs AppleScript in the server process, caching compiled scripts"""
+    
+    def __init__(self) -> None:
+        """
+        Initialize the OSAKit backend
+        
+        Raises:
+            AppleScriptError: If OSAKit is not available
+        """
+        if not osakit_available():
+            raise AppleScriptError("OSAKit is not available (install pyobjc-framework-OSAKit)")
+        
+        self._language = OSALanguage.languageForName_("AppleScript")
+        self._inline_scripts: "OrderedDict[str, Any]" = OrderedDict()
+        self._file_scripts: dict[Path, tuple[float, Any]] = {}
+    
+    def execute_source(self, source: str) -> str:
+        """
+        Execute AppleScript source, reusing the compiled script on repeat calls
+        
+        Args:
+            source: AppleScript code
+        
+        Returns:
+            Execution result as text
+        """
+        key = hashlib.blake2b(source.encode('utf-8'), digest_size=16).hexdigest()
+        script = self._inline_scripts.get(key)
+        if script is None:
+            script = self._compile(source)
+            self._inline_scripts[key] = script
+            if len(self._inline_scripts) > _INLINE_CACHE_SIZE:
+                self._inline_scripts.popitem(last=False)
+        else:
+            self._inline_scripts.move_to_end(key)
+        
+        result, error = script.executeAndReturnError_(None)
+        if result is None:
+            raise AppleScriptError(f"AppleScript execution failed: {self._error_message(error)}")
+        return self._descriptor_text(result)
+    
+    def call_handler(self, script_path: Path, function_name: str, args: list) -> str:
+        """
+        Call a handler in an AppleScript file
+        
+        The file is compiled once and recompiled only when it changes on disk.
+        
+        Args:
+            script_path: Path of the .applescript file
+            function_name: Handler name to call
+            args: List of arguments (str, int, float, bool or None)
+        
+        Returns:
+            Handler result as text
+        """
+        script = self.load_file(script_path)
+        descriptors = [self._to_descriptor(arg) for arg in args]
+        result, error = script.executeHandlerWithName_arguments_error_(function_name, descriptors, None)
+        if result is None:
+            raise AppleScriptError(f"AppleScript execution failed: {self._error_message(error)}")
+        return self._descriptor_text(result)
+    
+    def load_file(self, script_path: Path) -> Any:
+        """
+        Return the compiled script for a file, compiling it if new or changed
+        
+        Args:
+            script_path: Path of the .applescript file
+            
+        Returns:
+            Compiled OSAScript
+        """
+        mtime = script_path.stat().st_mtime
+        cached = self._file_scripts.get(script_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        script = self._compile(script_path.read_text(encoding='utf-8'))
+        self._file_scripts[script_path] = (mtime, script)
+        return script
+    
+    def _compile(self, source: str) -> Any:
+        """Compile AppleScript source into an OSAScript"""
+        script = OSAScript.alloc().initWithSource_language_(source, self._language)
+        ok, error = script.compileAndReturnError_(None)
+        if not ok:
+            raise AppleScriptError(f"AppleScript compilation failed: {self._error_message(error)}")
+        return script
+    
+    @staticmethod
+    def _to_descriptor(arg: Any) -> Any:
+        """Convert a Python argument to an Apple event descriptor"""
+        if isinstance(arg, bool):
+            return NSAppleEventDescriptor.descriptorWithBoolean_(arg)
+        if isinstance(arg, int):
+            return NSAppleEventDescriptor.descriptorWithInt32_(arg)
+        if isinstance(arg, float):
+            return NSAppleEventDescriptor.descriptorWithDouble_(arg)
+        if arg is None:
+            return NSAppleEventDescriptor.descriptorWithString_("")
+        return NSAppleEventDescriptor.descriptorWithString_(str(arg))
+    
+    @classmethod
+    def _descriptor_text(cls, descriptor: Any) -> str:
+        """
+        Convert a result descriptor to the text osascript would print
+        
+        Lists are joined with ", " to match osascript's output.
+        """
+        text = descriptor.stringValue()
+        if text is not None:
+            return str(text).strip()
+        
+        count = descriptor.numberOfItems()
+        if count > 0:
+            return ", ".join(
+                cls._descriptor_text(descriptor.descriptorAtIndex_(i))
+                for i in range(1, count + 1)
+            )
+        return ""
+    
+    @staticmethod
+    def _error_message(error: Any) -> str:
+        """Extract the message from an OSAKit error dictionary"""
+        if not error:
+            return "unknown error"
+        return str(error.get("OSAScriptErrorMessageKey") or error.get("OSAScriptErrorMessage") or error)
+
@@ -0,0 +1,142 @@
+"""
+Persistent AppleScript host process
+"""
+
+import queue
+import subprocess
+import threading
+from pathlib import Path
+from typing import Optional
+
+from .error_handler import AppleScriptError
+
+
+# Response header: status byte, 10-digit payload length, newline
+_HEADER_SIZE = 12
+
+
+class ScriptHost:
+    """Runs AppleScript source in one long-lived osascript process instead of one per call"""
+    
+    def __init__(self, host_script: Path) -> None:
+        """
+        Initialize the script host (the process starts on first use)
+        
+        Args:
+            host_script: Path of script_host.js
+        """
+        self.host_script = host_script
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+    
+    def execute(self, source: str) -> str:
+        """
+        Execute AppleScript source in the host process
+        
+        A host found dead before the script is sent is restarted once. If it
+        dies while running a script the call fails rather than re-running
+        a script that may already have taken effect.
+        
+        Args:
+            source: AppleScript code
+        
+        Returns:
+            Execution result
+        
+        Raises:
+            AppleScriptError: The script failed
+            OSError: The host process could not be started or reached
+        """
+        with self._lock:
+            try:
+                return self._request(source)
+            except BrokenPipeError:
+                self.close()
+                return self._request(source)
+            except EOFError:
+                self.close()
+                raise AppleScriptError("Script host exited while running the script")
+    
+    def close(self) -> None:
+        """Stop the host process"""
+        if self._process is not None:
+            try:
+                self._process.kill()
+                self._process.wait()
+            except OSError:
+                pass
+            self._process = None
+    
+    def _request(self, source: str) -> str:
+        """Send one script to the host and read its response"""
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["osascript", "-l", "JavaScript", str(self.host_script)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        
+        payload = source.encode('utf-8')
+        self._process.stdin.write(f"{len(payload):010d}\n".encode('ascii') + payload)
+        self._process.stdin.flush()
+        
+        header = self._read(_HEADER_SIZE)
+        status, length = header[:1], int(header[1:11])
+        text = self._read(length).decode('utf-8').strip()
+        
+        if status != b"S":
+            raise AppleScriptError(f"AppleScript execution failed: {text}")
+        return text
+    
+    def _read(self, size: int) -> bytes:
+        """Read exactly size bytes from the host"""
+        data = b""
+        while len(data) < size:
+            chunk = self._process.stdout.read(size - len(data))
+            if not chunk:
+                raise EOFError("Script host exited")
+            data += chunk
+        return data
+
+
+class ScriptHostPool:
+    """A fixed set of ScriptHosts, so concurrent callers each get a warm host"""
+    
+    def __init__(self, host_script: Path, size: int) -> None:
+        """
+        Initialize the pool (each host starts on first use)
+        
+        Args:
+            host_script: Path of script_host.js
+            size: Number of host processes
+        """
+        self._hosts: list[ScriptHost] = [ScriptHost(host_script) for _ in range(size)]
+        self._idle: "queue.Queue[ScriptHost]" = queue.Queue()
+        for host in self._hosts:
+            self._idle.put(host)
+    
+    def execute(self, source: str) -> str:
+        """
+        Execute AppleScript source in the next idle host
+        
+        Args:
+            source: AppleScript code
+        
+        Returns:
+            Execution result
+        
+        Raises:
+            AppleScriptError: The script failed
+            OSError: The host process could not be started or reached
+        """
+        host = self._idle.get()
+        try:
+            return host.execute(source)
+        finally:
+            self._idle.put(host)
+    
+    def close(self) -> None:
+        """Stop every host process"""
+        for host in self._hosts:
+            host.close()
@@ -0,0 +1,107 @@
+"""
+In-process read-only Keynote queries through ScriptingBridge (pyobjc)
+"""
+
+from typing import Any, List, Optional, Tuple
+
+from .error_handler import AppleScriptError
+
+try:
+    from ScriptingBridge import SBApplication
+except ImportError:  # pyobjc is only available on macOS
+    SBApplication = None
+
+
+def scripting_bridge_available() -> bool:
+    """Return True if the pyobjc ScriptingBridge bindings can be imported"""
+    return SBApplication is not None
+
+
+class KeynoteBridge:
+    """Answers read-only Keynote queries with Apple Events sent directly, without AppleScript"""
+    
+    def __init__(self, bundle_id: str) -> None:
+        """
+        Initialize the bridge (Keynote is contacted on first query)
+        
+        Args:
+            bundle_id: Keynote's bundle identifier
+        
+        Raises:
+            AppleScriptError: If ScriptingBridge is not available
+        """
+        if not scripting_bridge_available():
+            raise AppleScriptError("ScriptingBridge is not available (install pyobjc-framework-ScriptingBridge)")
+        
+        self.bundle_id = bundle_id
+        self._app: Optional[Any] = None
+    
+    def slide_count(self, doc_name: str) -> int:
+        """
+        Count the slides of a document
+        
+        Args:
+            doc_name: Document name, empty for the front document
+        
+        Returns:
+            Number of slides
+        """
+        return self._document(doc_name).slides().count()
+    
+    def layout_names(self, doc_name: str) -> Tuple[str, List[str]]:
+        """
+        List a document's slide layouts
+        
+        Args:
+            doc_name: Document name, empty for the front document
+        
+        Returns:
+            The resolved document name and the layout names
+        """
+        document = self._document(doc_name)
+        names = document.slideLayouts().arrayByApplyingSelector_("name")
+        return str(document.name()), [str(name) for name in names if name]
+    
+    def slide_info(self, doc_name: str, slide_number: int) -> Tuple[int, str, int]:
+        """
+        Describe one slide
+        
+        Args:
+            doc_name: Document name, empty for the front document
+            slide_number: Slide number (1-based)
+        
+        Returns:
+            Slide number, layout name and text item count
+        """
+        slides = self._document(doc_name).slides()
+        if slide_number > slides.count():
+            raise AppleScriptError(f"Slide {slide_number} does not exist")
+        
+        slide = slides.objectAtIndex_(slide_number - 1)
+        try:
+            layout_name = str(slide.baseSlide().name())
+        except Exception:
+            layout_name = "Unknown Layout"
+        return slide.slideNumber(), layout_name, slide.textItems().count()
+    
+    def _document(self, doc_name: str) -> Any:
+        """Resolve a document by name, or the front document when no name is given"""
+        documents = self._keynote().documents()
+        if not doc_name:
+            if documents.count() == 0:
+                raise AppleScriptError("No document is open in Keynote")
+            return documents.objectAtIndex_(0)
+        
+        # One Apple Event fetches every name, instead of one per document
+        names = list(documents.arrayByApplyingSelector_("name"))
+        if doc_name not in names:
+            raise AppleScriptError(f"Document not found: {doc_name}")
+        return documents.objectAtIndex_(names.index(doc_name))
+    
+    def _keynote(self) -> Any:
+        """Return the cached Keynote application handle"""
+        if self._app is None:
+            self._app = SBApplication.applicationWithBundleIdentifier_(self.bundle_id)
+            if self._app is None:
+                raise AppleScriptError("Keynote is not installed")
+        return self._app
@@ -88,10 +88,19 @@ def test_file_structure():
         "docs/THEME_AWARE_CONTENT.md"
     ]
     
+    # List each directory once instead of checking every file separately
+    root = os.path.dirname(os.path.abspath(__file__))
+    listings = {}
+    for directory in {os.path.dirname(file_path) for file_path in required_files}:
+        try:
+            listings[directory] = set(os.listdir(os.path.join(root, directory)))
+        except FileNotFoundError:
+            listings[directory] = set()
+    
     missing_files = []
     for file_path in required_files:
-        full_path = os.path.join(os.path.dirname(__file__), file_path)
-        if os.path.exists(full_path):
+        directory, name = os.path.split(file_path)
+        if name in listings[directory]:
             print(f"✅ {file_path}")
         else:
             print(f"❌ {file_path} - NOT FOUND")